@@ -3,6 +3,7 @@ import { describe, expect, it } from "vitest";
 import {
   BEARER_AUTH_JSON_RPC_CODE,
   BearerAuthError,
+  FIXED_BEARER_AUTH_MESSAGES,
   bearerAuthErrorToJsonRpc,
   extractBearer,
 } from "./auth.js";
@@ -145,6 +146,30 @@ describe("extractBearer", () => {
   });
 });
 
+describe("FIXED_BEARER_AUTH_MESSAGES", () => {
+  const messageFor = (authorization: string | undefined): string => {
+    const req = new Request("https://example.com/", {
+      headers: authorization === undefined ? {} : { authorization },
+    });
+    try {
+      extractBearer(req);
+    } catch (err) {
+      return (err as BearerAuthError).message;
+    }
+    throw new Error("expected to throw");
+  };
+
+  it("holds every message that carries no caller input", () => {
+    for (const header of [undefined, "Bearer", "sk-abc", "Bearer  sk-abc", "Bearer a,b"]) {
+      expect(FIXED_BEARER_AUTH_MESSAGES.has(messageFor(header))).toBe(true);
+    }
+  });
+
+  it("excludes the wrong-scheme message, which echoes the scheme sent", () => {
+    expect(FIXED_BEARER_AUTH_MESSAGES.has(messageFor("Scanner-1234 abc"))).toBe(false);
+  });
+});
+
 describe("bearerAuthErrorToJsonRpc", () => {
   it("maps a `missing` error to the shared JSON-RPC code with kind in data", () => {
     const err = new BearerAuthError("missing", "Authorization header is required");
@@ -24,6 +24,28 @@ export type BearerAuthErrorKind = "missing" | "malformed" | "empty";
  */
 const B64TOKEN_RE = /^[A-Za-z0-9\-._~+/]+=*$/;
 
+const MISSING_MESSAGE = "Authorization header is required";
+const EMPTY_MESSAGE = "Bearer token is empty";
+const NO_TOKEN_MESSAGE = "Authorization header must be of the form `Bearer <token>`";
+const DOUBLE_SPACE_MESSAGE =
+  "Authorization header must have exactly one space between scheme and token";
+const INVALID_CHARS_MESSAGE =
+  "Bearer token contains invalid characters (RFC 6750 §2.1 b64token)";
+
+/**
+ * Every `BearerAuthError` message that carries no caller input — all of
+ * them but the wrong-scheme one, which echoes the scheme that was sent.
+ * Only these are safe to key a long-lived cache on (see `bearerAuthBody`
+ * in `mcp.ts`).
+ */
+export const FIXED_BEARER_AUTH_MESSAGES: ReadonlySet<string> = new Set([
+  MISSING_MESSAGE,
+  EMPTY_MESSAGE,
+  NO_TOKEN_MESSAGE,
+  DOUBLE_SPACE_MESSAGE,
+  INVALID_CHARS_MESSAGE,
+]);
+
 /**
  * Thrown when the `Authorization` header cannot be parsed into a usable
  * Bearer token. Phase 2 tool wiring is responsible for turning this
@@ -56,61 +78,55 @@ export class BearerAuthError extends Error {
 export function extractBearer(request: Request): string {
   const header = request.headers.get("authorization");
   if (header === null) {
-    throw new BearerAuthError(
-      "missing",
-      "Authorization header is required",
-    );
+    throw new BearerAuthError("missing", MISSING_MESSAGE);
   }
 
   // Strict RFC 6750 shape: `Bearer <token>` with exactly one space.
-  // We split on the first space only so tokens containing `=` etc.
-  // pass through verbatim. Additional whitespace between scheme and
-  // token is ambiguous and rejected.
-  const firstSpace = header.indexOf(" ");
-
-  // Bare scheme with no token. Note that per HTTP spec the platform
-  // strips trailing whitespace from header values, so `Bearer` and
-  // `Bearer ` (trailing space, empty token) normalize to the same
-  // string by the time we see them. We call this case "empty" — it
-  // is the more actionable error for clients: they sent the scheme
-  // but forgot the token.
-  if (firstSpace === -1) {
-    if (header.toLowerCase() === "bearer") {
-      throw new BearerAuthError(
-        "empty",
-        "Bearer token is empty",
-      );
+  // Every real client sends the canonical `Bearer ` casing, so check it
+  // first: the token is then simply the rest of the header, with no
+  // case-folded copy of the scheme to compare. Any other casing (or no
+  // space at all) takes the general parse below.
+  let rest: string;
+  if (header.startsWith("Bearer ")) {
+    rest = header.slice("Bearer ".length);
+  } else {
+    // We split on the first space only so tokens containing `=` etc.
+    // pass through verbatim. Additional whitespace between scheme and
+    // token is ambiguous and rejected.
+    const firstSpace = header.indexOf(" ");
+
+    // Bare scheme with no token. Note that per HTTP spec the platform
+    // strips trailing whitespace from header values, so `Bearer` and
+    // `Bearer ` (trailing space, empty token) normalize to the same
+    // string by the time we see them. We call this case "empty" — it
+    // is the more actionable error for clients: they sent the scheme
+    // but forgot the token.
+    if (firstSpace === -1) {
+      if (header.toLowerCase() === "bearer") {
+        throw new BearerAuthError("empty", EMPTY_MESSAGE);
+      }
+      throw new BearerAuthError("malformed", NO_TOKEN_MESSAGE);
     }
-    throw new BearerAuthError(
-      "malformed",
-      "Authorization header must be of the form `Bearer <token>`",
-    );
-  }
 
-  const scheme = header.slice(0, firstSpace);
-  const rest = header.slice(firstSpace + 1);
+    const scheme = header.slice(0, firstSpace);
+    rest = header.slice(firstSpace + 1);
 
-  if (scheme.toLowerCase() !== "bearer") {
-    throw new BearerAuthError(
-      "malformed",
-      `Authorization scheme must be Bearer (got \`${scheme}\`)`,
-    );
+    if (scheme.toLowerCase() !== "bearer") {
+      throw new BearerAuthError(
+        "malformed",
+        `Authorization scheme must be Bearer (got \`${scheme}\`)`,
+      );
+    }
   }
 
   // Reject a second space immediately after the scheme separator —
   // `Bearer  token` (two spaces) is not valid per RFC 6750.
   if (rest.startsWith(" ")) {
-    throw new BearerAuthError(
-      "malformed",
-      "Authorization header must have exactly one space between scheme and token",
-    );
+    throw new BearerAuthError("malformed", DOUBLE_SPACE_MESSAGE);
   }
 
   if (rest.length === 0) {
-    throw new BearerAuthError(
-      "empty",
-      "Bearer token is empty",
-    );
+    throw new BearerAuthError("empty", EMPTY_MESSAGE);
   }
 
   // Enforce RFC 6750 §2.1 `b64token` charset. Rejects space-in-token
@@ -118,10 +134,7 @@ export function extractBearer(request: Request): string {
   // and any other non-b64token characters. Without this check we would
   // forward garbage to Django and produce a confusing upstream 401.
   if (!B64TOKEN_RE.test(rest)) {
-    throw new BearerAuthError(
-      "malformed",
-      "Bearer token contains invalid characters (RFC 6750 §2.1 b64token)",
-    );
+    throw new BearerAuthError("malformed", INVALID_CHARS_MESSAGE);
   }
 
   return rest;
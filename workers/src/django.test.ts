@@ -70,6 +70,8 @@ describe("djangoGet", () => {
     const err = await djangoGet(envTrailing, TOKEN, "/api/v1/x").catch((e) => e);
     expect(err).toBeInstanceOf(Error);
     expect((err as Error).message).toMatch(/trailing slash/i);
+    // The binding's value is logged server-side, never surfaced to a client.
+    expect((err as Error).message).not.toContain("trytako.com");
   });
 
   it("throws when DJANGO_BASE_URL is empty", async () => {
@@ -269,3 +271,27 @@ describe("djangoPost", () => {
     expect(url.searchParams.get("format")).toBe("json");
   });
 });
+
+describe("no per-isolate queue", () => {
+  it("issues every call straight away, however many are in flight", async () => {
+    // The isolate is shared across invocations, and a cancelled invocation
+    // never runs its cleanup — a module-scope slot count would leak one
+    // slot per cancellation until every call queued forever. The runtime
+    // already bounds connections per invocation, so nothing here may wait.
+    const releases: Array<() => void> = [];
+    const fetchMock = vi.fn<typeof fetch>(
+      () =>
+        new Promise<Response>((resolve) => {
+          releases.push(() => resolve(jsonResponse(200, {})));
+        }),
+    );
+    vi.stubGlobal("fetch", fetchMock);
+
+    const calls = Array.from({ length: 100 }, () => djangoGet(ENV, TOKEN, "/api/v1/x"));
+    await new Promise((r) => setTimeout(r, 0));
+    expect(fetchMock).toHaveBeenCalledTimes(100);
+
+    for (const release of releases) release();
+    await Promise.all(calls);
+  });
+});
@@ -214,11 +214,8 @@ export async function djangoGet<T>(
   opts: DjangoGetOptions = {},
 ): Promise<T> {
   const url = buildUrl(env, path, opts.query);
-  const headers = new Headers({
-    "X-API-Key": token,
-  });
   return executeRequest<T>(
-    new Request(url, { method: "GET", headers }),
+    new Request(url, { method: "GET", headers: { "X-API-Key": token } }),
     { path, method: "GET", timeoutMs: opts.timeoutMs ?? DEFAULT_TIMEOUT_MS },
   );
 }
@@ -229,17 +226,36 @@ export async function djangoPost<T>(
   path: string,
   body: unknown,
   opts: DjangoPostOptions = {},
+): Promise<T> {
+  return djangoPostJson<T>(env, token, path, JSON.stringify(body), opts);
+}
+
+/**
+ * `djangoPost` for a body the caller has already serialized. Callers that
+ * need the JSON text for something else too — the response cache keys on
+ * it — pass it here instead of paying for a second `JSON.stringify` of the
+ * same payload.
+ */
+export async function djangoPostJson<T>(
+  env: Env,
+  token: string,
+  path: string,
+  json: string,
+  opts: DjangoPostOptions = {},
 ): Promise<T> {
   const url = buildUrl(env, path, opts.query);
-  const headers = new Headers({
+  // A plain record, not a `Headers`: `Request` copies whatever init it is
+  // given into its own header list, so an intermediate `Headers` (or a
+  // cached one per token) was an extra object built only to be copied.
+  const headers = {
     "X-API-Key": token,
     "Content-Type": "application/json",
-  });
+  };
   return executeRequest<T>(
     new Request(url, {
       method: "POST",
       headers,
-      body: JSON.stringify(body),
+      body: json,
     }),
     { path, method: "POST", timeoutMs: opts.timeoutMs ?? DEFAULT_TIMEOUT_MS },
   );
@@ -249,27 +265,47 @@ export async function djangoPost<T>(
 /* Internals                                                           */
 /* ------------------------------------------------------------------ */
 
-function buildUrl(
-  env: Env,
-  path: string,
-  query?: Record<string, string | number | boolean>,
-): string {
+/**
+ * The last `DJANGO_BASE_URL` that passed validation. Workers reuse an
+ * isolate across many invocations and the global `fetch` already pools
+ * upstream connections per isolate, so the only per-call "client setup"
+ * left in this module is re-checking the same binding on every request.
+ * One module-scope entry is enough: a deployment has exactly one base URL
+ * (tests swap envs, which just re-validates and replaces the entry).
+ * Failures are never cached so a misconfigured binding keeps failing loud.
+ */
+let lastValidatedBase: string | undefined;
+
+function validatedBase(env: Env): string {
+  const base = env.DJANGO_BASE_URL;
+  if (base !== undefined && base === lastValidatedBase) return base;
   // Validate the base URL up-front. An empty / missing binding would
   // otherwise produce a URL like `/api/v1/x` (which is not a legal
   // absolute URL for `new Request(...)`) and a trailing slash would
   // produce `//api/v1/x` (wrong origin interpretation). We fail loud
   // here rather than silently forwarding broken requests to Django.
-  const base = env.DJANGO_BASE_URL;
   if (base === undefined || base === "") {
     throw new Error(
       "DJANGO_BASE_URL is not configured (empty or undefined binding)",
     );
   }
   if (base.endsWith("/")) {
-    throw new Error(
-      `DJANGO_BASE_URL must not end with a trailing slash (got \`${base}\`)`,
-    );
+    // The binding's value goes to the server log only. Non-Django throws
+    // reach the client verbatim through the SDK's generic tool error, and
+    // error responses must never carry internal URLs.
+    console.error(`[mcp] DJANGO_BASE_URL has a trailing slash: ${base}`);
+    throw new Error("DJANGO_BASE_URL must not end with a trailing slash");
   }
+  lastValidatedBase = base;
+  return base;
+}
+
+function buildUrl(
+  env: Env,
+  path: string,
+  query?: Record<string, string | number | boolean>,
+): string {
+  const base = validatedBase(env);
   // `path` is expected to start with `/api/v1/...`. We require the
   // leading slash so concatenation produces a well-formed URL (the
   // alternative would be silent corruption like
@@ -388,11 +424,18 @@ async function executeRequest<T>(
   }
 }
 
+/**
+ * Error names that mean our own abort signal fired. `AbortSignal.timeout`
+ * rejects with a `TimeoutError`; a manual `abort()` and some runtimes'
+ * fetch shims report `AbortError`.
+ */
+const ABORT_ERROR_NAMES = new Set(["AbortError", "TimeoutError"]);
+
 function isAbortError(err: unknown): boolean {
-  if (err instanceof DOMException && err.name === "AbortError") return true;
-  if (err instanceof Error && err.name === "AbortError") return true;
-  if (err instanceof Error && err.name === "TimeoutError") return true;
-  return false;
+  return (
+    (err instanceof DOMException || err instanceof Error) &&
+    ABORT_ERROR_NAMES.has(err.name)
+  );
 }
 
 /**
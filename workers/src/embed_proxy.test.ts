@@ -27,6 +27,7 @@ import type { Env } from "./env.js";
 import {
   handleCdnAssetProxy,
   handleEmbedProxy,
+  isValidPubId,
   parsePubId,
   rewriteCdnUrls,
   sanitizeEmbedHtml,
@@ -94,6 +95,15 @@ describe("parsePubId", () => {
   });
 });
 
+describe("isValidPubId", () => {
+  it("accepts the bare id and nothing that is not one", () => {
+    expect(isValidPubId(PUB_ID)).toBe(true);
+    for (const bad of ["", "a/b", "a.b", "%2f", "a".repeat(65)]) {
+      expect(isValidPubId(bad), bad).toBe(false);
+    }
+  });
+});
+
 describe("sanitizeEmbedHtml", () => {
   it("removes the csrfToken and reports having done so", () => {
     const out = sanitizeEmbedHtml(UPSTREAM_HTML);
@@ -106,6 +106,13 @@ const UPSTREAM_TIMEOUT_MS = 6_000;
  */
 const MAX_BODY_BYTES = 2 * 1024 * 1024;
 
+/**
+ * One decoder for every upstream body. A non-streaming `decode` keeps no
+ * state between calls, so the instance is safe to share across requests in
+ * the isolate rather than constructing a fresh one per page and per asset.
+ */
+const utf8 = new TextDecoder();
+
 /**
  * Ceiling on a JavaScript body we will buffer in order to rewrite its CDN urls.
  * `Card.js` is ~1.5 MB today and rewriting means holding the body and its copy,
@@ -271,13 +278,21 @@ async function rateLimited(request: Request, env: Env): Promise<Response | undef
  */
 const PUB_ID_RE = /^[A-Za-z0-9_-]{1,64}$/;
 
+/**
+ * Whether `value` has the pub_id shape. Shared with the chart widget's
+ * dynamic resource, which takes its pub_id from a client-supplied URI.
+ */
+export function isValidPubId(value: string): boolean {
+  return PUB_ID_RE.test(value);
+}
+
 /** Extract and validate the pub_id from `/embed-html/{pub_id}`. */
 export function parsePubId(pathname: string): string | undefined {
   if (!pathname.startsWith(EMBED_PROXY_PREFIX)) return undefined;
   const raw = pathname.slice(EMBED_PROXY_PREFIX.length);
   // A trailing slash is tolerated; anything else with a slash is rejected.
   const candidate = raw.endsWith("/") ? raw.slice(0, -1) : raw;
-  return PUB_ID_RE.test(candidate) ? candidate : undefined;
+  return isValidPubId(candidate) ? candidate : undefined;
 }
 
 /**
@@ -499,7 +514,7 @@ export async function handleEmbedProxy(
     return textResponse("upstream body too large", 502);
   }
 
-  const sanitized = sanitizeEmbedHtml(new TextDecoder().decode(buffer));
+  const sanitized = sanitizeEmbedHtml(utf8.decode(buffer));
   // Repoint every CDN URL at our own passthrough. Without this the page loads
   // in the widget and then every asset dies on the CDN's CORS allow-list — the
   // exact half-render this route exists to avoid.
@@ -814,7 +829,7 @@ export async function handleCdnAssetProxy(
       return new Response(bytes, { status: 200, headers });
     }
     const { widgetOrigin } = origins;
-    const body = new TextDecoder().decode(bytes);
+    const body = utf8.decode(bytes);
     if (widgetOrigin !== undefined && body.includes(cdnBase)) {
       const rewritten = rewriteCdnUrls(
         body,
@@ -309,8 +309,30 @@ export interface Env {
    * it 404s previously-installed sessions).
    */
   WIDGET_URI_SUFFIX?: string;
+  /**
+   * Opt-in TTL, in seconds, for the per-isolate response cache behind
+   * `tako_search`, `tako_answer` and the graph reads of `tako_graph_*` and
+   * `tako_available_data` (see `tools/_response_cache.ts`). A plain `vars`
+   * entry, not a secret.
+   * Unset, empty, or non-positive disables the cache, which is the default
+   * everywhere: a hit can hide a card published inside the window, so an
+   * environment turns it on deliberately.
+   */
+  SEARCH_CACHE_TTL_SECONDS?: string;
 }
 
+/**
+ * Origins that already passed `validatePublicOrigin`. The check is a pure
+ * function of the string, and the same handful of bindings is re-checked on
+ * every chart URL, CSP list and widget origin a request builds — each time
+ * paying for a `new URL` parse. The label only shapes error messages, so
+ * one set serves every caller. Failures are never recorded, so a bad
+ * binding keeps failing loud; the cap only matters for tests that cycle
+ * many envs.
+ */
+const validatedOrigins = new Set<string>();
+const MAX_VALIDATED_ORIGINS = 16;
+
 /**
  * Resolve a public-facing origin and validate it against the same
  * invariants `django.ts::buildUrl` enforces for the Django origin:
@@ -325,6 +347,7 @@ export interface Env {
  * security boundary.
  */
 export function validatePublicOrigin(raw: string | undefined, label: string): string {
+  if (raw !== undefined && validatedOrigins.has(raw)) return raw;
   if (raw === undefined || raw === "") {
     throw new Error(
       `Neither ${label} nor DJANGO_BASE_URL is configured (empty or undefined binding)`,
@@ -349,6 +372,8 @@ export function validatePublicOrigin(raw: string | undefined, label: string): st
       `public base URL must use http or https (got \`${parsed.protocol}\`)`,
     );
   }
+  if (validatedOrigins.size >= MAX_VALIDATED_ORIGINS) validatedOrigins.clear();
+  validatedOrigins.add(raw);
   return raw;
 }
 
@@ -279,7 +279,12 @@ async function readBoundedJson(
   const clone = request.clone();
   if (clone.body === null) return { kind: "unparseable" };
   const reader = clone.body.getReader();
-  const chunks: Uint8Array[] = [];
+  // Decode as the chunks arrive (`stream: true` carries a multi-byte
+  // sequence split across a chunk boundary into the next call) instead of
+  // buffering every chunk and then copying them into one joined array just
+  // to decode it — the bytes are held once, not twice.
+  const decoder = new TextDecoder();
+  const parts: string[] = [];
   let totalBytes = 0;
   for (;;) {
     const { done, value } = await reader.read();
@@ -289,16 +294,11 @@ async function readBoundedJson(
       await reader.cancel();
       return { kind: "too_large" };
     }
-    chunks.push(value);
-  }
-  const joined = new Uint8Array(totalBytes);
-  let offset = 0;
-  for (const chunk of chunks) {
-    joined.set(chunk, offset);
-    offset += chunk.byteLength;
+    parts.push(decoder.decode(value, { stream: true }));
   }
+  parts.push(decoder.decode());
   try {
-    return { kind: "ok", body: JSON.parse(new TextDecoder().decode(joined)) };
+    return { kind: "ok", body: JSON.parse(parts.join("")) };
   } catch {
     return { kind: "unparseable" };
   }
@@ -342,6 +342,23 @@ async function hitPerIpLimiter(
 export const FREE_TIER_LIMIT_MESSAGE =
   "Rate limit reached for anonymous access. Try again in a minute.";
 
+/**
+ * The id-less 429 body. The id-less rejection bodies carry nothing
+ * request-specific, so each is serialized once at module load rather than
+ * on every rejected request — the rejection paths are exactly the ones an
+ * abusive client hammers. (`Response` objects themselves cannot be shared:
+ * a body is single-use.)
+ */
+const FREE_TIER_LIMIT_BODY = JSON.stringify({
+  jsonrpc: "2.0",
+  id: null,
+  error: {
+    code: -32000,
+    message: FREE_TIER_LIMIT_MESSAGE,
+    data: { kind: "rate_limited" },
+  },
+});
+
 /**
  * Response for an over-limit metered `tools/call`.
  *
@@ -361,24 +378,13 @@ export const FREE_TIER_LIMIT_MESSAGE =
  */
 export function freeTierLimitResponse(requestId: JsonRpcRequestId): Response {
   if (requestId === null) {
-    return new Response(
-      JSON.stringify({
-        jsonrpc: "2.0",
-        id: null,
-        error: {
-          code: -32000,
-          message: FREE_TIER_LIMIT_MESSAGE,
-          data: { kind: "rate_limited" },
-        },
-      }),
-      {
-        status: 429,
-        headers: {
-          "Content-Type": "application/json; charset=utf-8",
-          "Retry-After": "60",
-        },
+    return new Response(FREE_TIER_LIMIT_BODY, {
+      status: 429,
+      headers: {
+        "Content-Type": "application/json; charset=utf-8",
+        "Retry-After": "60",
       },
-    );
+    });
   }
   return new Response(
     JSON.stringify({
@@ -409,6 +415,25 @@ export function freeTierLimitResponse(requestId: JsonRpcRequestId): Response {
 export const FREE_TIER_GLOBAL_LIMIT_MESSAGE =
   "Anonymous access is at capacity right now. Try again shortly.";
 
+/** The id-less per-colo 429 body, serialized once (see `FREE_TIER_LIMIT_BODY`). */
+const FREE_TIER_GLOBAL_LIMIT_BODY = JSON.stringify({
+  jsonrpc: "2.0",
+  id: null,
+  error: {
+    code: -32000,
+    // A distinct kind from the per-IP bucket, on purpose. Collapsing
+    // the two was tried and reverted: the two messages say different
+    // things anyway, so a caller reads the topology off `message` just
+    // as easily as off `kind`. Hiding it in one field and not the other
+    // bought nothing and broke a client-visible contract. If the
+    // topology ever needs to be genuinely opaque, the MESSAGES have to
+    // converge first — and that costs the caller the difference between
+    // "slow down" and "come back later".
+    message: FREE_TIER_GLOBAL_LIMIT_MESSAGE,
+    data: { kind: "global_rate_limited" },
+  },
+});
+
 /**
  * Response for a request over the per-colo anonymous ceiling. Same
  * readability rule as `freeTierLimitResponse`: when the tripping request
@@ -421,32 +446,13 @@ export function freeTierGlobalLimitResponse(
   requestId: JsonRpcRequestId,
 ): Response {
   if (requestId === null) {
-    return new Response(
-      JSON.stringify({
-        jsonrpc: "2.0",
-        id: null,
-        error: {
-          code: -32000,
-          // A distinct kind from the per-IP bucket, on purpose. Collapsing
-          // the two was tried and reverted: the two messages say different
-          // things anyway, so a caller reads the topology off `message` just
-          // as easily as off `kind`. Hiding it in one field and not the other
-          // bought nothing and broke a client-visible contract. If the
-          // topology ever needs to be genuinely opaque, the MESSAGES have to
-          // converge first — and that costs the caller the difference between
-          // "slow down" and "come back later".
-          message: FREE_TIER_GLOBAL_LIMIT_MESSAGE,
-          data: { kind: "global_rate_limited" },
-        },
-      }),
-      {
-        status: 429,
-        headers: {
-          "Content-Type": "application/json; charset=utf-8",
-          "Retry-After": "60",
-        },
+    return new Response(FREE_TIER_GLOBAL_LIMIT_BODY, {
+      status: 429,
+      headers: {
+        "Content-Type": "application/json; charset=utf-8",
+        "Retry-After": "60",
       },
-    );
+    });
   }
   return new Response(
     JSON.stringify({
@@ -474,27 +480,27 @@ export const FREE_TIER_TOO_LARGE_MESSAGE =
   `Request body is too large for anonymous access. The limit is ` +
   `${MAX_FREE_TIER_BODY_BYTES} bytes.`;
 
+/** The id-less 413 body, serialized once (see `FREE_TIER_LIMIT_BODY`). */
+const FREE_TIER_TOO_LARGE_BODY = JSON.stringify({
+  jsonrpc: "2.0",
+  id: null,
+  error: {
+    code: -32600,
+    message: FREE_TIER_TOO_LARGE_MESSAGE,
+    data: { kind: "payload_too_large" },
+  },
+});
+
 /**
  * HTTP 413 for an anonymous body over `MAX_FREE_TIER_BODY_BYTES` (or with
  * an unparseable `Content-Length`). Rejected before any buffering — see
  * step 2 in `checkFreeTierRateLimit`.
  */
 export function freeTierTooLargeResponse(): Response {
-  return new Response(
-    JSON.stringify({
-      jsonrpc: "2.0",
-      id: null,
-      error: {
-        code: -32600,
-        message: FREE_TIER_TOO_LARGE_MESSAGE,
-        data: { kind: "payload_too_large" },
-      },
-    }),
-    {
-      status: 413,
-      headers: { "Content-Type": "application/json; charset=utf-8" },
-    },
-  );
+  return new Response(FREE_TIER_TOO_LARGE_BODY, {
+    status: 413,
+    headers: { "Content-Type": "application/json; charset=utf-8" },
+  });
 }
 
 /**
@@ -509,6 +515,17 @@ export const FREE_TIER_BATCH_MESSAGE =
   "Batch requests are not supported for anonymous access. Send one " +
   "JSON-RPC request per POST.";
 
+/** The batch-rejection body, serialized once (see `FREE_TIER_LIMIT_BODY`). */
+const FREE_TIER_BATCH_BODY = JSON.stringify({
+  jsonrpc: "2.0",
+  id: null,
+  error: {
+    code: -32600,
+    message: FREE_TIER_BATCH_MESSAGE,
+    data: { kind: "batch_not_supported" },
+  },
+});
+
 /**
  * HTTP 400 for an anonymous JSON-RPC batch (array body). `id: null` (a
  * batch has no single request id, and this runs before the SDK would parse
@@ -516,23 +533,12 @@ export const FREE_TIER_BATCH_MESSAGE =
  * a valid request shape per the 2025-06-18 MCP spec).
  */
 export function freeTierBatchResponse(): Response {
-  return new Response(
-    JSON.stringify({
-      jsonrpc: "2.0",
-      id: null,
-      error: {
-        code: -32600,
-        message: FREE_TIER_BATCH_MESSAGE,
-        data: { kind: "batch_not_supported" },
-      },
-    }),
-    {
-      status: 400,
-      headers: {
-        "Content-Type": "application/json; charset=utf-8",
-      },
+  return new Response(FREE_TIER_BATCH_BODY, {
+    status: 400,
+    headers: {
+      "Content-Type": "application/json; charset=utf-8",
     },
-  );
+  });
 }
 
 /**
@@ -47,6 +47,9 @@ const ICON_MAP: Record<string, string> = {
 // 86 400 keeps the worker from hammering CloudFront on every request.
 const ICON_CACHE_MAX_AGE_SECONDS = 86_400;
 
+// Built once: the value never varies per request.
+const ICON_CACHE_CONTROL = `public, max-age=${ICON_CACHE_MAX_AGE_SECONDS}, s-maxage=${ICON_CACHE_MAX_AGE_SECONDS}`;
+
 export async function handleIconRequest(pathname: string): Promise<Response> {
   const upstreamName = ICON_MAP[pathname];
   if (upstreamName === undefined) {
@@ -82,14 +85,12 @@ export async function handleIconRequest(pathname: string): Promise<Response> {
   // Forward only the bits we actually want. CloudFront sends a pile of
   // amz-* / cache-control headers we don't want bleeding through into
   // our response surface.
-  const headers = new Headers();
+  // A plain record: `Response` copies its init headers into its own list,
+  // so an intermediate `Headers` would only be built to be copied.
+  const headers: Record<string, string> = { "cache-control": ICON_CACHE_CONTROL };
   const upstreamContentType = upstream.headers.get("content-type");
   if (upstreamContentType !== null) {
-    headers.set("content-type", upstreamContentType);
+    headers["content-type"] = upstreamContentType;
   }
-  headers.set(
-    "cache-control",
-    `public, max-age=${ICON_CACHE_MAX_AGE_SECONDS}, s-maxage=${ICON_CACHE_MAX_AGE_SECONDS}`,
-  );
   return new Response(upstream.body, { status: 200, headers });
 }
@@ -15,15 +15,62 @@ import {
   handleToken,
 } from "./oauth/handlers.js";
 
+/**
+ * Response init for the `/health` probe. The body is a fresh "ok" per call
+ * (a body can only be read once), but the init never varies, so uptime
+ * checks don't rebuild it.
+ */
+const HEALTH_INIT: ResponseInit = {
+  status: 200,
+  headers: { "content-type": "text/plain; charset=utf-8" },
+};
+
+/** Init for the catch-all 404; scanner traffic hits it constantly. */
+const NOT_FOUND_INIT: ResponseInit = {
+  status: 404,
+  headers: { "content-type": "text/plain; charset=utf-8" },
+};
+
+/** Init for the GET/DELETE `/mcp` 405 (see the note at its use). */
+const MCP_METHOD_NOT_ALLOWED_INIT: ResponseInit = {
+  status: 405,
+  headers: {
+    allow: "POST",
+    "content-type": "text/plain; charset=utf-8",
+  },
+};
+
+type RouteHandler = (request: Request, env: Env) => Response | Promise<Response>;
+
+/**
+ * The exact-path OAuth routes. Not method-gated here: each handler checks
+ * the method itself. `/register`, `/token` and `/revoke` are called from
+ * browser-based submission flows and carry CORS; `/authorize`, `/login` and
+ * the callback are top-level navigations and do not.
+ *
+ * `/login/password` is the email + password sign-in: a server-side form POST
+ * rather than a browser-SDK call, so the password never passes through the
+ * CDN-loaded Stytch script and the session lands via the same cookie
+ * Google's redirect uses. Because this table is exact-match only, it needs
+ * no ordering relative to `/login`; a future prefix handler for `/login*`
+ * would have to be checked before the lookup.
+ */
+const OAUTH_ROUTES = new Map<string, RouteHandler>([
+  ["/register", async (request, env) => withCors(await handleRegister(request, env))],
+  ["/authorize", handleAuthorize],
+  ["/token", async (request, env) => withCors(await handleToken(request, env))],
+  ["/revoke", (request, env) => withCors(handleRevoke(request, env))],
+  ["/login", handleLogin],
+  ["/login/password", handleLoginPassword],
+  ["/oauth/stytch_callback", handleStytchCallback],
+]);
+
 export default {
   async fetch(request: Request, env: Env): Promise<Response> {
     const url = new URL(request.url);
 
     if (request.method === "GET" && url.pathname === "/health") {
-      return new Response("ok", {
-        status: 200,
-        headers: { "content-type": "text/plain; charset=utf-8" },
-      });
+      return new Response("ok", HEALTH_INIT);
     }
 
     if (request.method === "POST" && url.pathname === "/mcp") {
@@ -91,13 +138,7 @@ export default {
       (request.method === "GET" || request.method === "DELETE") &&
       url.pathname === "/mcp"
     ) {
-      return new Response("method not allowed", {
-        status: 405,
-        headers: {
-          allow: "POST",
-          "content-type": "text/plain; charset=utf-8",
-        },
-      });
+      return new Response("method not allowed", MCP_METHOD_NOT_ALLOWED_INIT);
     }
 
     // OpenAI connector-directory domain verification. During the
@@ -146,39 +187,11 @@ export default {
     ) {
       return withCors(handleAuthServerMetadata(request, env));
     }
-    if (url.pathname === "/register") {
-      return withCors(await handleRegister(request, env));
-    }
-    if (url.pathname === "/authorize") {
-      return handleAuthorize(request, env);
-    }
-    if (url.pathname === "/token") {
-      return withCors(await handleToken(request, env));
-    }
-    if (url.pathname === "/revoke") {
-      return withCors(handleRevoke(request, env));
-    }
-    if (url.pathname === "/login") {
-      return handleLogin(request, env);
-    }
-    // Email + password sign-in. A server-side form POST rather than a
-    // browser-SDK call, so the password never passes through the CDN-loaded
-    // Stytch script and the session lands via the same cookie Google's
-    // redirect uses.
-    //
-    // Every OAuth route here is an EXACT `pathname ===` compare, so this needs
-    // no particular position relative to `/login` above. Any future
-    // `startsWith("/login")` handler would have to go below this line.
-    if (url.pathname === "/login/password") {
-      return handleLoginPassword(request, env);
-    }
-    if (url.pathname === "/oauth/stytch_callback") {
-      return handleStytchCallback(request, env);
-    }
+    // Every remaining OAuth route is an EXACT path match, dispatched from
+    // one table rather than a chain of compares (see `OAUTH_ROUTES`).
+    const oauthRoute = OAUTH_ROUTES.get(url.pathname);
+    if (oauthRoute !== undefined) return oauthRoute(request, env);
 
-    return new Response("not found", {
-      status: 404,
-      headers: { "content-type": "text/plain; charset=utf-8" },
-    });
+    return new Response("not found", NOT_FOUND_INIT);
   },
 } satisfies ExportedHandler<Env>;
@@ -15,6 +15,7 @@ import {
 
 import {
   BearerAuthError,
+  FIXED_BEARER_AUTH_MESSAGES,
   bearerAuthErrorToJsonRpc,
   extractBearer,
 } from "./auth.js";
@@ -1119,16 +1120,21 @@ function registerTool(
       // prose-heavy results) when declared, else the JSON-stringified
       // output. A throwing renderer degrades to the JSON fallback rather
       // than failing the call.
+      //
+      // The fallback is COMPACT JSON. Pretty-printing (`null, 2`) costs a
+      // second pass of indentation work on every call and inflates the text
+      // channel by roughly a quarter on nested graph/visualize payloads —
+      // whitespace the model pays tokens for and gains nothing from.
       let text: string;
       if (tool.renderText !== undefined) {
         try {
           text = tool.renderText(output, callCtx);
         } catch (err) {
           console.error(`renderText hook failed for ${tool.name}:`, err);
-          text = JSON.stringify(output, null, 2);
+          text = JSON.stringify(output);
         }
       } else {
-        text = JSON.stringify(output, null, 2);
+        text = JSON.stringify(output);
       }
       const content: Array<
         | { type: "text"; text: string }
@@ -1406,6 +1412,17 @@ function djangoErrorKind(err: DjangoError): string {
   return "unknown";
 }
 
+/**
+ * The last-resort 500 body from `handleMcpRequest`'s outer catch. Constant
+ * (`id: null`, fixed code and message — nothing from the failure reaches the
+ * client), so it is serialized once at module load rather than per failure.
+ */
+const INTERNAL_ERROR_BODY = JSON.stringify({
+  jsonrpc: "2.0",
+  id: null,
+  error: { code: -32603, message: "Internal error" },
+});
+
 /**
  * Handle a POST /mcp request using a stateless Streamable HTTP transport.
  *
@@ -1450,7 +1467,11 @@ export async function handleMcpRequest(
     }
   }
 
-  const origin = new URL(request.url).origin;
+  // Parsed once for the whole request: the origin feeds the OAuth audience
+  // check here, and the same URL supplies the icon base and the `tools`
+  // query param below.
+  const url = new URL(request.url);
+  const origin = url.origin;
   let token: string;
   let tier: Tier;
   if (bearer === null && freeTier !== null) {
@@ -1520,8 +1541,7 @@ export async function handleMcpRequest(
     // env (mcp.tako.com, mcp.staging.tako.com, *.workers.dev) advertises
     // icons it itself serves under `/icons/*`. Prevents staging
     // connectors from referencing prod URLs and vice versa.
-    const url = new URL(request.url);
-    const requestOrigin = url.origin;
+    const requestOrigin = origin;
     // Detect calling client from User-Agent so we can route the chart
     // widget to ChatGPT and Claude (unknown clients fall back to the
     // inline PNG) and route ChatGPT through the agent split pair. See
@@ -1597,15 +1617,29 @@ export async function handleMcpRequest(
     const requestForLogging = request.clone();
     try {
       const response = await transport.handleRequest(request);
-      await logSdkValidationRejections(requestForLogging, response);
+      // Both taps below read the same buffered JSON body. Parse it once and
+      // hand each the shared promise — a large `tools/list` or chart result
+      // was otherwise cloned and JSON-parsed twice on every ChatGPT call.
+      // Each tap keeps its own failure handling around the await, so the
+      // no-op catch here only stops a rejection nobody awaited (non-POST)
+      // from surfacing as unhandled.
+      const bufferedBody = readBufferedJson(response);
+      bufferedBody.catch(() => {});
       // ChatGPT-only compatibility adapter: rewrite the buffered
       // `tools/list` response to carry the top-level `securitySchemes`
       // field its Apps SDK reads (the MCP SDK cannot serialize unknown
       // descriptor fields — see `tools/_security.ts`). Every other
       // client gets the SDK's response untouched.
-      return client === "chatgpt"
-        ? await withChatGptToolSecuritySchemes(response, tier)
-        : response;
+      //
+      // The two taps share nothing but the parsed body, so they run
+      // together instead of the adapter waiting out the logging tap.
+      const [, adapted] = await Promise.all([
+        logSdkValidationRejections(requestForLogging, response, bufferedBody),
+        client === "chatgpt"
+          ? withChatGptToolSecuritySchemes(response, tier, bufferedBody)
+          : response,
+      ]);
+      return adapted;
     } finally {
       // TODO(Phase 2): revisit this unconditional close.
       //
@@ -1628,20 +1662,28 @@ export async function handleMcpRequest(
     // Log to Workers Logs (observability is enabled in wrangler.jsonc) so
     // production incidents still produce a signal.
     console.error("mcp handler error:", err);
-    return new Response(
-      JSON.stringify({
-        jsonrpc: "2.0",
-        id: null,
-        error: { code: -32603, message: "Internal error" },
-      }),
-      {
-        status: 500,
-        headers: { "Content-Type": "application/json; charset=utf-8" },
-      },
-    );
+    return new Response(INTERNAL_ERROR_BODY, {
+      status: 500,
+      headers: { "Content-Type": "application/json; charset=utf-8" },
+    });
   }
 }
 
+/** Sentinel from {@link readBufferedJson}: the response is not JSON at all. */
+const NOT_JSON = Symbol("not-json");
+
+/**
+ * Parse a buffered response's JSON body without consuming it (reads a
+ * clone). Resolves to {@link NOT_JSON} for a non-JSON content type and
+ * REJECTS on a malformed body, leaving each caller to decide whether that
+ * is worth a log line.
+ */
+async function readBufferedJson(response: Response): Promise<unknown> {
+  const contentType = response.headers.get("content-type") ?? "";
+  if (!contentType.includes("application/json")) return NOT_JSON;
+  return (await response.clone().json()) as unknown;
+}
+
 /**
  * ChatGPT compatibility adapter: add the top-level `securitySchemes` field
  * to every tool descriptor in a buffered `tools/list` JSON response.
@@ -1656,17 +1698,19 @@ export async function handleMcpRequest(
  * stream — the same invariant `logSdkValidationRejections` relies on.
  *
  * Best-effort: any parse failure returns the original response unchanged.
+ * `bufferedBody` is an already-started {@link readBufferedJson} of this
+ * same response, so `handleMcpRequest` parses the body once for both taps.
  * Non-`tools/list` bodies pass through untouched (the transform only
  * matches messages with a `result.tools` array).
  */
 export async function withChatGptToolSecuritySchemes(
   response: Response,
   tier: Tier,
+  bufferedBody?: Promise<unknown>,
 ): Promise<Response> {
   try {
-    const contentType = response.headers.get("content-type") ?? "";
-    if (!contentType.includes("application/json")) return response;
-    const body = (await response.clone().json()) as unknown;
+    const body = await (bufferedBody ?? readBufferedJson(response));
+    if (body === NOT_JSON) return response;
     const transformed = withToolSecuritySchemes(body, {
       client: "chatgpt",
       tier,
@@ -1711,18 +1755,20 @@ export async function withChatGptToolSecuritySchemes(
  * no stream can be truncated) logs each rejection with its tool name to
  * Workers Logs.
  *
- * `request` must be a clone whose body has not been consumed. Never throws:
- * a malformed body here must not break serving the already-built response.
+ * `request` must be a clone whose body has not been consumed; `bufferedBody`
+ * is the shared parse described on `withChatGptToolSecuritySchemes`. Never
+ * throws: a malformed body here must not break serving the already-built
+ * response.
  */
 export async function logSdkValidationRejections(
   request: Request,
   response: Response,
+  bufferedBody?: Promise<unknown>,
 ): Promise<void> {
   try {
     if (request.method !== "POST") return;
-    const contentType = response.headers.get("content-type") ?? "";
-    if (!contentType.includes("application/json")) return;
-    const responseBody = (await response.clone().json()) as unknown;
+    const responseBody = await (bufferedBody ?? readBufferedJson(response));
+    if (responseBody === NOT_JSON) return;
     const responseMessages = Array.isArray(responseBody)
       ? responseBody
       : [responseBody];
@@ -1782,20 +1828,35 @@ export async function logSdkValidationRejections(
  */
 function bearerAuthResponse(request: Request, err: BearerAuthError): Response {
   const origin = new URL(request.url).origin;
-  return new Response(
-    JSON.stringify({
-      jsonrpc: "2.0",
-      id: null,
-      error: bearerAuthErrorToJsonRpc(err),
-    }),
-    {
-      status: 401,
-      headers: {
-        "Content-Type": "application/json; charset=utf-8",
-        "WWW-Authenticate": wwwAuthenticate(origin, "invalid_token"),
-      },
+  return new Response(bearerAuthBody(err), {
+    status: 401,
+    headers: {
+      "Content-Type": "application/json; charset=utf-8",
+      "WWW-Authenticate": wwwAuthenticate(origin, "invalid_token"),
     },
-  );
+  });
+}
+
+/**
+ * Serialized 401 envelopes for the fixed-message errors, keyed by message.
+ * `id` is always null here, so every unauthenticated probe of `/mcp` (each
+ * OAuth bootstrap starts with one) re-serialized one of a handful of
+ * identical bodies. The wrong-scheme message echoes caller input, so it is
+ * built per call and never enters the map — scanner traffic cannot grow it
+ * past `FIXED_BEARER_AUTH_MESSAGES`.
+ */
+const bearerAuthBodies = new Map<string, string>();
+
+function bearerAuthBody(err: BearerAuthError): string {
+  const cached = bearerAuthBodies.get(err.message);
+  if (cached !== undefined) return cached;
+  const body = JSON.stringify({
+    jsonrpc: "2.0",
+    id: null,
+    error: bearerAuthErrorToJsonRpc(err),
+  });
+  if (FIXED_BEARER_AUTH_MESSAGES.has(err.message)) bearerAuthBodies.set(err.message, body);
+  return body;
 }
 
 /**
@@ -249,6 +249,28 @@ function redirectAuthError(
 
 /* --------------------------- Discovery --------------------------- */
 
+/**
+ * Serialized discovery documents, keyed by kind and request origin. Both
+ * documents are a pure function of the origin, and connectors re-fetch
+ * them on every connect, so each was rebuilt and re-stringified per hit.
+ * An isolate only ever serves a handful of origins (prod plus a preview
+ * host or two); past the ceiling the map is simply reset.
+ */
+const discoveryDocs = new Map<string, string>();
+const MAX_DISCOVERY_DOCS = 16;
+
+/** A JSON response for a discovery document, serializing it on first use. */
+function discoveryResponse(kind: string, origin: string, build: () => unknown): Response {
+  const key = `${kind}\u0000${origin}`;
+  let json = discoveryDocs.get(key);
+  if (json === undefined) {
+    if (discoveryDocs.size >= MAX_DISCOVERY_DOCS) discoveryDocs.clear();
+    json = JSON.stringify(build());
+    discoveryDocs.set(key, json);
+  }
+  return new Response(json, { headers: { "content-type": "application/json" } });
+}
+
 /**
  * RFC 9728 — OAuth 2.0 Protected Resource Metadata.
  *
@@ -264,14 +286,14 @@ export function handleProtectedResourceMetadata(
   if (readConfig(env) === null) {
     return new Response("not found", { status: 404 });
   }
-  return Response.json({
+  return discoveryResponse("protected-resource", new URL(req.url).origin, () => ({
     // The MCP endpoint URL is the canonical resource identifier (RFC 8707).
     // Issued tokens are audienced to this value and `/mcp` validates it.
     resource: serverResource(req),
     authorization_servers: [serverIssuer(req)],
     bearer_methods_supported: ["header"],
     scopes_supported: [...SUPPORTED_SCOPES],
-  });
+  }));
 }
 
 /**
@@ -287,7 +309,7 @@ export function handleAuthServerMetadata(
     return new Response("not found", { status: 404 });
   }
   const origin = new URL(req.url).origin;
-  return Response.json({
+  return discoveryResponse("auth-server", origin, () => ({
     issuer: origin,
     authorization_endpoint: `${origin}/authorize`,
     token_endpoint: `${origin}/token`,
@@ -302,7 +324,7 @@ export function handleAuthServerMetadata(
     token_endpoint_auth_methods_supported: ["none"],
     revocation_endpoint_auth_methods_supported: ["none"],
     scopes_supported: [...SUPPORTED_SCOPES],
-  });
+  }));
 }
 
 /**
@@ -365,15 +387,17 @@ const CONTROL_CHARS_RE = /[\x00-\x1f\x7f]/;
  *  partner client", so a bad value is a loud 401. */
 const PARTNER_TOKEN_HEADER = "x-tako-partner-token";
 
+/** Shared by every `constantTimeEqual` call; `TextEncoder` is stateless. */
+const utf8Encoder = new TextEncoder();
+
 /**
  * Compare two secrets without leaking their contents through timing.
  * Length is compared first and therefore leaks — standard for this
  * construction, and the length of a 32-byte random secret is not sensitive.
  */
 function constantTimeEqual(a: string, b: string): boolean {
-  const enc = new TextEncoder();
-  const ab = enc.encode(a);
-  const bb = enc.encode(b);
+  const ab = utf8Encoder.encode(a);
+  const bb = utf8Encoder.encode(b);
   if (ab.length !== bb.length) return false;
   let diff = 0;
   for (let i = 0; i < ab.length; i++) diff |= ab[i]! ^ bb[i]!;
@@ -1364,8 +1388,12 @@ async function issueTokens(
     exp: now + REFRESH_TOKEN_TTL_S,
     jti: crypto.randomUUID(),
   };
-  const access_token = await signJwt(accessClaims, cfg.signKey);
-  const refresh_token = await signJwt(refreshClaims, cfg.signKey);
+  // The two signatures are independent, so sign them concurrently rather
+  // than paying two sequential SubtleCrypto round trips on every token grant.
+  const [access_token, refresh_token] = await Promise.all([
+    signJwt(accessClaims, cfg.signKey),
+    signJwt(refreshClaims, cfg.signKey),
+  ]);
   return Response.json({
     access_token,
     token_type: "Bearer",
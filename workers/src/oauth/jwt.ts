@@ -60,23 +60,54 @@ export interface JwtClaims {
   [k: string]: unknown;
 }
 
-async function importHmacKey(secret: string): Promise<CryptoKey> {
-  return crypto.subtle.importKey(
+/**
+ * Upper bound on distinct secrets whose imported `CryptoKey` we keep. A
+ * deployment signs with one `OAUTH_SIGN_KEY` (two during a rotation), so
+ * this only matters for tests and misconfiguration; past it the cache is
+ * simply reset rather than tracking recency.
+ */
+const MAX_CACHED_KEYS = 8;
+
+/**
+ * Imported HMAC keys, keyed by secret. `importKey` is an async SubtleCrypto
+ * round trip, and every JWT we sign or verify (auth codes, state cookies,
+ * access tokens on every `/mcp` call) used to repeat it for the same
+ * secret. One module-scope map lets warm isolates import each secret once.
+ * The PROMISE is cached so concurrent first callers share one import; a
+ * rejected import is evicted so a bad secret keeps failing instead of
+ * being pinned.
+ */
+const hmacKeys = new Map<string, Promise<CryptoKey>>();
+
+function importHmacKey(secret: string): Promise<CryptoKey> {
+  const cached = hmacKeys.get(secret);
+  if (cached !== undefined) return cached;
+  if (hmacKeys.size >= MAX_CACHED_KEYS) hmacKeys.clear();
+  const imported = crypto.subtle.importKey(
     "raw",
     enc.encode(secret),
     { name: "HMAC", hash: "SHA-256" },
     false,
     ["sign", "verify"],
   );
+  hmacKeys.set(secret, imported);
+  imported.catch(() => hmacKeys.delete(secret));
+  return imported;
 }
 
+/**
+ * The encoded JOSE header. Every token we mint is HS256, so the header
+ * segment is a constant — encode it once at module load rather than
+ * re-serializing and re-encoding it on every `signJwt`.
+ */
+const HS256_HEADER_B64 = b64url(JSON.stringify({ alg: "HS256", typ: "JWT" }));
+
 export async function signJwt<T extends JwtClaims>(
   payload: T,
   secret: string,
 ): Promise<string> {
-  const header = b64url(JSON.stringify({ alg: "HS256", typ: "JWT" }));
   const body = b64url(JSON.stringify(payload));
-  const data = `${header}.${body}`;
+  const data = `${HS256_HEADER_B64}.${body}`;
   const key = await importHmacKey(secret);
   const sig = await crypto.subtle.sign("HMAC", key, enc.encode(data));
   return `${data}.${b64url(sig)}`;
@@ -162,7 +193,7 @@ const AES_IV_BYTES = 12;
  * output, which is the most natural way to mint one. Length is enforced to
  * fail loud on a misconfigured secret.
  */
-async function importAesKey(b64Key: string): Promise<CryptoKey> {
+async function decodeAesKey(b64Key: string): Promise<CryptoKey> {
   const padded = b64Key.replace(/-/g, "+").replace(/_/g, "/") +
     "=".repeat((4 - (b64Key.length % 4)) % 4);
   const bin = atob(padded);
@@ -182,6 +213,24 @@ async function importAesKey(b64Key: string): Promise<CryptoKey> {
   );
 }
 
+/**
+ * Imported AES keys, keyed by the base64 secret. Same shape as `hmacKeys`:
+ * the upstream API key rides encrypted inside every access token, so each
+ * authenticated `/mcp` call decrypts under `OAUTH_ENC_KEY` and used to
+ * re-decode and re-import the identical key first.
+ */
+const aesKeys = new Map<string, Promise<CryptoKey>>();
+
+function importAesKey(b64Key: string): Promise<CryptoKey> {
+  const cached = aesKeys.get(b64Key);
+  if (cached !== undefined) return cached;
+  if (aesKeys.size >= MAX_CACHED_KEYS) aesKeys.clear();
+  const imported = decodeAesKey(b64Key);
+  aesKeys.set(b64Key, imported);
+  imported.catch(() => aesKeys.delete(b64Key));
+  return imported;
+}
+
 /**
  * Encrypt a string with AES-GCM under `OAUTH_ENC_KEY`. The output bundles
  * the 12-byte IV with the ciphertext+tag (`iv || ct+tag`) into a single
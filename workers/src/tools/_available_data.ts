@@ -195,7 +195,10 @@ const emptyGroup = (kind: CoverageKind): CoverageGroup => ({
  * with the markdown renderer, which flattens node names and ids into their own
  * single-line slots for the same reason.
  */
-export const oneLine = (v: string): string => v.replace(/\s*\n\s*/g, " ").trim();
+export const oneLine = (v: string): string =>
+  // Almost every name is already one line; the substring test skips the regex
+  // pass for those, and `trim()` is all the replace would have left to do.
+  v.includes("\n") ? v.replace(/\s*\n\s*/g, " ").trim() : v.trim();
 
 function plural(n: number, one: string, many: string): string {
   return n === 1 ? one : many;
@@ -207,9 +210,11 @@ function plural(n: number, one: string, many: string): string {
  * order. Only reorders the preview slice — never drops a name.
  */
 function partitionLowSignal<T>(xs: readonly T[], nameOf: (x: T) => string): T[] {
-  const clean = xs.filter((x) => !LOW_SIGNAL_METRIC.test(nameOf(x)));
-  const noisy = xs.filter((x) => LOW_SIGNAL_METRIC.test(nameOf(x)));
-  return [...clean, ...noisy];
+  // One pass, one regex test per name: a full drill is hundreds of names.
+  const clean: T[] = [];
+  const noisy: T[] = [];
+  for (const x of xs) (LOW_SIGNAL_METRIC.test(nameOf(x)) ? noisy : clean).push(x);
+  return clean.concat(noisy);
 }
 
 /** Headline-first ordering over name+id pairs. */
@@ -230,10 +235,14 @@ export function selectCoverage(
   // Carry the node id alongside every name — `graph/related` items are graph
   // nodes, so the id is already in hand and is the only thing that makes a
   // pinned follow-up precise (see CoverageItem).
-  const raw: CoverageItem[] = group.items.map((i) => ({ name: i.name, node_id: i.id }));
-  const ordered = kind === "metrics" ? orderMetricItems(raw) : raw;
-  const total = group.total ?? ordered.length;
-  const items = ordered.slice(0, MAX_COVERAGE_NAMES);
+  // Entities keep the backend order, so only the kept slice is mapped;
+  // metrics are reordered over the full list first.
+  const toItem = (i: GraphRelation["items"][number]): CoverageItem => ({ name: i.name, node_id: i.id });
+  const total = group.total ?? group.items.length;
+  const items =
+    kind === "metrics"
+      ? orderMetricItems(group.items.map(toItem)).slice(0, MAX_COVERAGE_NAMES)
+      : group.items.slice(0, MAX_COVERAGE_NAMES).map(toItem);
   const capped = group.total_capped ?? false;
   return {
     kind,
@@ -1,11 +1,15 @@
-import { describe, expect, it } from "vitest";
+import { afterEach, describe, expect, it, vi } from "vitest";
 
 import type { Env } from "../env.js";
 import {
   __chart_widget_test_only__,
   APP_UI_RESOURCE_URI,
+  MAX_INLINE_DATA_URL_BYTES,
+  MAX_INLINE_PNG_BYTES,
   appUiResourceUri,
   buildChartAppUiResourceFromOutputPubId,
+  fetchImageDataUrlAndDims,
+  fetchPngContentBlock,
 } from "./_chart_widget.js";
 
 const ENV: Env = { DJANGO_BASE_URL: "https://staging.trytako.com" };
@@ -59,6 +63,42 @@ describe("appUiResourceUri (dev cache-bust)", () => {
   });
 });
 
+describe("oversize Content-Length", () => {
+  afterEach(() => {
+    vi.unstubAllGlobals();
+    vi.restoreAllMocks();
+  });
+
+  // A body that never yields: a handler that read it instead of refusing on
+  // the declared length would hang the test rather than pass it.
+  const stubImage = (declaredBytes: number) => {
+    const cancel = vi.fn();
+    vi.stubGlobal(
+      "fetch",
+      vi.fn<typeof fetch>(async () =>
+        new Response(new ReadableStream({ cancel }), {
+          status: 200,
+          headers: { "content-type": "image/png", "content-length": String(declaredBytes) },
+        }),
+      ),
+    );
+    vi.spyOn(console, "warn").mockImplementation(() => undefined);
+    return cancel;
+  };
+
+  it("refuses the data-URL fetch before reading the body", async () => {
+    const cancel = stubImage(MAX_INLINE_DATA_URL_BYTES + 1);
+    expect(await fetchImageDataUrlAndDims("https://img.test/c.png")).toBeUndefined();
+    expect(cancel).toHaveBeenCalled();
+  });
+
+  it("refuses the PNG content block before reading the body", async () => {
+    const cancel = stubImage(MAX_INLINE_PNG_BYTES + 1);
+    expect(await fetchPngContentBlock("https://img.test/c.png")).toEqual([]);
+    expect(cancel).toHaveBeenCalled();
+  });
+});
+
 describe("chart widget HTML", () => {
   it("notifies height via the MCP Apps size-changed notification", () => {
     const ui = buildChartAppUiResourceFromOutputPubId(ENV);
@@ -86,6 +126,18 @@ describe("chart widget HTML", () => {
     expect(html).toContain('addEventListener("load"');
   });
 
+  it("ships the baked variant without source comments or indentation", () => {
+    const html = __chart_widget_test_only__.buildBakedWidgetHtml({
+      embedUrl: "https://staging.trytako.com/embed/abc123/?dark_mode=auto",
+      imageDataUrl: "data:image/png;base64,AAAA",
+      naturalWidth: 800,
+      naturalHeight: 600,
+    });
+    expect(html).not.toMatch(/^\s*\/\//m);
+    expect(html).not.toContain("  function notify");
+    expect(html).toContain("notify();");
+  });
+
   it("positions the empty state out of flow so it cannot grow the box", () => {
     // Two properties carry the design and neither is cosmetic: `position:
     // fixed` fills the host's reserved viewport without contributing to
@@ -39,7 +39,7 @@ import {
   resolvePublicCdnBase,
   resolveWidgetOrigin,
 } from "../env.js";
-import { EMBED_PROXY_PREFIX } from "../embed_proxy.js";
+import { EMBED_PROXY_PREFIX, isValidPubId } from "../embed_proxy.js";
 import type {
   AppUiResource,
   ToolContext,
@@ -326,6 +326,8 @@ const MAX_INLINE_WIDGET_HEIGHT_PX = 500;
 // scrollable overflow inside the widget is not.
 const ASSUMED_WIDGET_WIDTH_PX = 800;
 
+const HTML_UNSAFE_RE = /[&<>"']/;
+
 /**
  * HTML-escape a string for safe interpolation into attribute values
  * or text content. Base64 data URIs and standard URLs don't normally
@@ -334,6 +336,10 @@ const ASSUMED_WIDGET_WIDTH_PX = 800;
  * angle-brackets or quotes into one.
  */
 function htmlEscape(s: string): string {
+  // Card URLs and base64 data URIs almost never hold one of these, and the
+  // data URI runs to hundreds of KB — one scan that finds nothing beats
+  // five `replace` passes that each copy the whole string.
+  if (!HTML_UNSAFE_RE.test(s)) return s;
   return s
     .replace(/&/g, "&amp;")
     .replace(/</g, "&lt;")
@@ -389,7 +395,42 @@ function buildBakedWidgetHtml(opts: {
   // the card's, in either theme.
   return `<!doctype html>
 <html lang="en" style="min-height: ${initialHeight}px;">
-<head>
+${BAKED_WIDGET_HEAD}
+<body style="min-height: ${initialHeight}px;">
+<a
+  id="tako-embed-link"
+  target="_blank"
+  rel="noopener noreferrer"
+  title="Open interactive chart"
+  href="${safeEmbedUrl}"
+><img id="tako-embed-img" alt="Tako chart" width="${opts.naturalWidth}" height="${opts.naturalHeight}" src="${safeDataUrl}" /></a>
+${BAKED_WIDGET_SCRIPT}
+</body>
+</html>`;
+}
+
+/**
+ * Drop indentation, blank lines and whole-line `//` comments from a markup
+ * template. The baked variant ships inside every chart tool result, so the
+ * explanatory comments in its script were paid for on the wire each call;
+ * the source keeps them, the payload does not. Line breaks stay, so a
+ * trailing `//` comment could never swallow the code after it — only lines
+ * that are nothing BUT a comment are removed.
+ */
+function compactMarkup(src: string): string {
+  return src
+    .split("\n")
+    .map((line) => line.trim())
+    .filter((line) => line !== "" && !line.startsWith("//"))
+    .join("\n");
+}
+
+/**
+ * The baked widget's `<head>`, which carries nothing per chart. Built once at
+ * module load so `buildBakedWidgetHtml` only interpolates the per-chart
+ * values; `BAKED_WIDGET_SCRIPT` is the same for the trailing script.
+ */
+const BAKED_WIDGET_HEAD = compactMarkup(`<head>
 <meta charset="utf-8" />
 <meta name="viewport" content="width=device-width, initial-scale=1" />
 <meta name="x-tako-widget" content="open_chart_ui_baked/v1" />
@@ -400,16 +441,9 @@ function buildBakedWidgetHtml(opts: {
   #tako-embed-link:hover #tako-embed-img { opacity: 0.95; }
   #tako-embed-img { width: 100%; height: auto; max-height: ${MAX_INLINE_WIDGET_HEIGHT_PX}px; object-fit: contain; display: block; background: transparent; transition: opacity 120ms ease-out; }
 </style>
-</head>
-<body style="min-height: ${initialHeight}px;">
-<a
-  id="tako-embed-link"
-  target="_blank"
-  rel="noopener noreferrer"
-  title="Open interactive chart"
-  href="${safeEmbedUrl}"
-><img id="tako-embed-img" alt="Tako chart" width="${opts.naturalWidth}" height="${opts.naturalHeight}" src="${safeDataUrl}" /></a>
-<script>
+</head>`);
+
+const BAKED_WIDGET_SCRIPT = compactMarkup(`<script>
 (function(){
   "use strict";
   function notify(){
@@ -447,10 +481,7 @@ function buildBakedWidgetHtml(opts: {
   var img = document.getElementById("tako-embed-img");
   if (img) img.addEventListener("load", notify);
 })();
-</script>
-</body>
-</html>`;
-}
+</script>`);
 
 /**
  * Render a fallback widget when we couldn't fetch the chart image.
@@ -2174,6 +2205,29 @@ function parsePngDimensions(
   return { width, height };
 }
 
+/**
+ * Release a response we are bailing on without reading. The runtime keeps a
+ * small per-invocation pool of open connections, and an unread body pins its
+ * connection until garbage collection, so an early return after a 404 or an
+ * HTML error page would otherwise hold a slot that the next chart fetch (or
+ * a Django call in the same invocation) has to wait for. Cancelling hands
+ * the connection back immediately.
+ */
+function discardBody(response: Response): void {
+  response.body?.cancel().catch(() => {});
+}
+
+/**
+ * The response's declared `Content-Length`, or 0 when absent or unparseable.
+ * Lets an oversize image be refused before its body is buffered — the
+ * post-read byte check still covers responses that declare no length
+ * (chunked), so 0 here only ever means "unknown, read and measure".
+ */
+function declaredLength(response: Response): number {
+  const n = Number(response.headers.get("content-length"));
+  return Number.isFinite(n) && n > 0 ? n : 0;
+}
+
 /**
  * Fetch ONLY a chart PNG's pixel dimensions, via a ranged request for the
  * first 64 bytes.
@@ -2226,6 +2280,7 @@ export async function fetchPngDimensions(
     });
     // 206 (ranged) and 200 (server ignored Range) are both usable.
     if (!response.ok && response.status !== 206) {
+      discardBody(response);
       console.warn(
         `[tako] chart PNG header fetch failed: HTTP ${response.status} from ${url}`,
       );
@@ -2296,6 +2351,7 @@ export async function fetchImageDataUrlAndDims(
   try {
     const response = await fetch(url, { signal: controller.signal });
     if (!response.ok) {
+      discardBody(response);
       console.warn(
         `[tako] chart image_data_url fetch failed: HTTP ${response.status} from ${url}`,
       );
@@ -2306,11 +2362,20 @@ export async function fetchImageDataUrlAndDims(
     // HTML error page would otherwise let us base64 HTML and ship it
     // as a `data:image/...` URI the client can't render.
     if (!contentType.startsWith("image/")) {
+      discardBody(response);
       console.warn(
         `[tako] chart image_data_url fetch failed: unexpected content-type "${contentType}" from ${url}`,
       );
       return undefined;
     }
+    const declared = declaredLength(response);
+    if (declared > MAX_INLINE_DATA_URL_BYTES) {
+      discardBody(response);
+      console.warn(
+        `[tako] chart image_data_url fetch failed: oversize content-length (${declared} bytes) from ${url}`,
+      );
+      return undefined;
+    }
     const buffer = await response.arrayBuffer();
     if (buffer.byteLength === 0) {
       console.warn(`[tako] chart image_data_url fetch failed: empty body from ${url}`);
@@ -2368,6 +2433,7 @@ export async function fetchPngContentBlock(
     // Windsurf, Gemini CLI, …), so a silent `[]` here is "the chart never
     // shows up" with nothing to tail.
     if (!response.ok) {
+      discardBody(response);
       console.warn(`[tako-widget] png content block: status=${response.status} url=${url}`);
       return [];
     }
@@ -2376,9 +2442,18 @@ export async function fetchPngContentBlock(
     // otherwise let us base64 HTML and ship it as `mimeType:
     // "image/png"` — a garbage block the client would try to render.
     if (!contentType.startsWith("image/")) {
+      discardBody(response);
       console.warn(`[tako-widget] png content block: non-image content-type=${contentType} url=${url}`);
       return [];
     }
+    const declared = declaredLength(response);
+    if (declared > MAX_INLINE_PNG_BYTES) {
+      discardBody(response);
+      console.warn(
+        `[tako-widget] png content block: oversize content-length=${declared} url=${url}`,
+      );
+      return [];
+    }
     const buffer = await response.arrayBuffer();
     // 0-byte 200 is plausible if a renderer returned early; emitting
     // `{ data: "", mimeType: "image/png" }` would have clients try to
@@ -2436,6 +2511,15 @@ export function buildChartAppUiResource(
   resolveUriFromInput: (input: unknown, output?: unknown) => string | undefined,
 ): AppUiResource {
   const webBase = resolvePublicBase(env);
+  // This worker's own origin as the widget reaches it, resolved once for both
+  // CSP lists below; `undefined` unless the `PUBLIC_CDN_URL` experiment is
+  // armed. Same resolver the native-card URL uses, so the origin we DECLARE
+  // and the origin the widget FETCHES can never disagree — a mismatch there
+  // is a CSP block that looks like a broken proxy.
+  const widgetOrigin =
+    resolvePublicCdnBase(env) !== undefined
+      ? resolveWidgetOrigin(env, requestOrigin)
+      : undefined;
   return {
     // Static URI — registered as before, used by ChatGPT (which reads
     // the widget URI from `_meta["openai/outputTemplate"]`) for its
@@ -2467,14 +2551,7 @@ export function buildChartAppUiResource(
     // unknown, and `mcp.ts` omits the key entirely then. Never tako.com: the
     // widget always goes through our proxy, because the embed route itself
     // serves no CORS header.
-    connectDomains: (() => {
-      if (resolvePublicCdnBase(env) === undefined) return [];
-      // Same resolver the native-card URL uses, so the origin we DECLARE and
-      // the origin the widget FETCHES can never disagree — a mismatch there is
-      // a CSP block that looks like a broken proxy.
-      const widgetOrigin = resolveWidgetOrigin(env, requestOrigin);
-      return widgetOrigin === undefined ? [] : [widgetOrigin];
-    })(),
+    connectDomains: widgetOrigin === undefined ? [] : [widgetOrigin],
     resourceDomains: [
       ...new Set(
         [
@@ -2485,9 +2562,7 @@ export function buildChartAppUiResource(
           // because the CDN answers CORS for tako.com alone and a module script
           // is always a CORS fetch. Declaring the CDN here would be dead weight
           // — nothing loads from it in the widget any more.
-          resolvePublicCdnBase(env) !== undefined
-            ? resolveWidgetOrigin(env, requestOrigin)
-            : undefined,
+          widgetOrigin,
         ].filter((origin): origin is string => origin !== undefined),
       ),
     ],
@@ -2514,6 +2589,11 @@ export function buildChartAppUiResource(
         if (pubId === "") {
           return buildFallbackWidgetHtml(webBase, "Missing chart identifier.");
         }
+        // The URI is client-supplied: refuse a malformed id here rather than
+        // spend an upstream image fetch (and its timeout) on a certain 404.
+        if (!isValidPubId(pubId)) {
+          return buildFallbackWidgetHtml(webBase, "Invalid chart identifier.");
+        }
         const { embed_url, image_url } = buildChartUrls(env, pubId, true);
         // The resource read happens with a valid request-context
         // `ctx.token`, so authenticated PNG endpoints (if any) would
@@ -2555,6 +2635,37 @@ export function buildChartAppUiResource(
 export function buildChartAppUiResourceFromOutputPubId(
   env: Env,
   requestOrigin?: string,
+): AppUiResource {
+  // Memoized per (env, origin): all three chart tools ask for this on every
+  // `createMcpServer`, and the result is a pure function of the two. Keyed
+  // weakly on the env object so an isolate that gets a fresh env never pins
+  // the old one — a different env is simply a miss.
+  let byOrigin = chartResources.get(env);
+  if (byOrigin === undefined) {
+    byOrigin = new Map();
+    chartResources.set(env, byOrigin);
+  }
+  const originKey = requestOrigin ?? "";
+  const cached = byOrigin.get(originKey);
+  if (cached !== undefined) return cached;
+  if (byOrigin.size >= MAX_CHART_RESOURCES_PER_ENV) byOrigin.clear();
+  const built = buildChartAppUiResourceForOutputPubId(env, requestOrigin);
+  byOrigin.set(originKey, built);
+  return built;
+}
+
+/**
+ * Built chart `AppUiResource`s, per env object and request origin. The
+ * registration loop in `mcp.ts` only reads the descriptor, so sharing one
+ * across requests is safe. An isolate serves a handful of origins; past the
+ * ceiling the inner map is simply reset.
+ */
+const chartResources = new WeakMap<Env, Map<string, AppUiResource>>();
+const MAX_CHART_RESOURCES_PER_ENV = 16;
+
+function buildChartAppUiResourceForOutputPubId(
+  env: Env,
+  requestOrigin: string | undefined,
 ): AppUiResource {
   return buildChartAppUiResource(env, requestOrigin, (_input, output) => {
     const pubId =
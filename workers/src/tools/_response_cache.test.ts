@@ -0,0 +1,169 @@
+import { afterEach, describe, expect, it, vi } from "vitest";
+
+import { DjangoBadRequestError, DjangoHttpError } from "../django.js";
+import type { Env } from "../env.js";
+import {
+  NEGATIVE_CACHE_MAX_TTL_MS,
+  RESPONSE_CACHE_MAX_ENTRIES,
+  __response_cache_test_only__,
+  cachedCall,
+  responseCacheKey,
+  responseCacheTtlMs,
+} from "./_response_cache.js";
+
+/** Join bound for calls that are not about the bound itself. */
+const WAIT = 60_000;
+
+afterEach(() => {
+  __response_cache_test_only__.reset();
+  vi.useRealTimers();
+});
+
+describe("responseCacheTtlMs", () => {
+  it("is disabled unless SEARCH_CACHE_TTL_SECONDS is a positive number", () => {
+    const base: Env = { DJANGO_BASE_URL: "https://trytako.com" };
+    expect(responseCacheTtlMs(base)).toBe(0);
+    expect(responseCacheTtlMs({ ...base, SEARCH_CACHE_TTL_SECONDS: "" })).toBe(0);
+    expect(responseCacheTtlMs({ ...base, SEARCH_CACHE_TTL_SECONDS: "soon" })).toBe(0);
+    expect(responseCacheTtlMs({ ...base, SEARCH_CACHE_TTL_SECONDS: "-5" })).toBe(0);
+    expect(responseCacheTtlMs({ ...base, SEARCH_CACHE_TTL_SECONDS: "60" })).toBe(60_000);
+  });
+});
+
+describe("responseCacheKey", () => {
+  it("separates tokens so one user's results never serve another", () => {
+    expect(responseCacheKey("sk-a", "/p/", '{"q":1}')).not.toBe(
+      responseCacheKey("sk-b", "/p/", '{"q":1}'),
+    );
+  });
+});
+
+describe("cachedCall", () => {
+  it("calls through every time when the TTL is 0", async () => {
+    const call = vi.fn(async () => "v");
+    await cachedCall("k", 0, WAIT, call);
+    await cachedCall("k", 0, WAIT, call);
+    expect(call).toHaveBeenCalledTimes(2);
+    expect(__response_cache_test_only__.size()).toBe(0);
+  });
+
+  it("does not join an identical call in flight when the TTL is 0", async () => {
+    const call = vi.fn(async () => "v");
+    await Promise.all([cachedCall("k", 0, WAIT, call), cachedCall("k", 0, WAIT, call)]);
+    expect(call).toHaveBeenCalledTimes(2);
+  });
+
+  it("serves a repeat inside the TTL and refetches after it expires", async () => {
+    vi.useFakeTimers();
+    let n = 0;
+    const call = vi.fn(async () => ({ n: ++n }));
+    expect(await cachedCall("k", 1000, WAIT, call)).toEqual({ n: 1 });
+    expect(await cachedCall("k", 1000, WAIT, call)).toEqual({ n: 1 });
+    expect(call).toHaveBeenCalledTimes(1);
+    vi.advanceTimersByTime(1001);
+    expect(await cachedCall("k", 1000, WAIT, call)).toEqual({ n: 2 });
+    expect(call).toHaveBeenCalledTimes(2);
+  });
+
+  it("shares one upstream call between concurrent identical misses", async () => {
+    let release: (v: string) => void = () => {};
+    const call = vi.fn(() => new Promise<string>((r) => (release = r)));
+    const first = cachedCall("k", 1000, WAIT, call);
+    const second = cachedCall("k", 1000, WAIT, call);
+    release("shared");
+    expect(await Promise.all([first, second])).toEqual(["shared", "shared"]);
+    expect(call).toHaveBeenCalledTimes(1);
+  });
+
+  it("stops waiting on a call that never settles and runs its own", async () => {
+    // A cancelled invocation leaves its in-flight promise pending forever;
+    // a later identical call must not inherit the hang.
+    vi.useFakeTimers();
+    const dead = vi.fn(() => new Promise<string>(() => {}));
+    void cachedCall("k", 1000, 500, dead);
+    const live = vi.fn(async () => "fresh");
+    const joiner = cachedCall("k", 1000, 500, live);
+    await vi.advanceTimersByTimeAsync(501);
+    expect(await joiner).toBe("fresh");
+    expect(live).toHaveBeenCalledTimes(1);
+    // The replacement result is what the cache now serves.
+    expect(await cachedCall("k", 1000, 500, dead)).toBe("fresh");
+    expect(dead).toHaveBeenCalledTimes(1);
+  });
+
+  it("does not let a late-settling stale call evict the call that replaced it", async () => {
+    vi.useFakeTimers();
+    let failStale: (err: Error) => void = () => {};
+    const stale = cachedCall(
+      "k",
+      1000,
+      500,
+      () => new Promise<string>((_, reject) => (failStale = reject)),
+    ).catch(() => "stale failed");
+    let releaseFresh: (v: string) => void = () => {};
+    const fresh = vi.fn(() => new Promise<string>((r) => (releaseFresh = r)));
+    const replacement = cachedCall("k", 1000, 500, fresh);
+    await vi.advanceTimersByTimeAsync(501);
+    expect(fresh).toHaveBeenCalledTimes(1);
+    failStale(new Error("landed late"));
+    expect(await stale).toBe("stale failed");
+    // Still joins the replacement, not a fresh upstream call.
+    const joiner = cachedCall("k", 1000, 500, fresh);
+    releaseFresh("fresh");
+    expect(await Promise.all([replacement, joiner])).toEqual(["fresh", "fresh"]);
+    expect(fresh).toHaveBeenCalledTimes(1);
+  });
+
+  it("never caches a failure", async () => {
+    const call = vi
+      .fn<() => Promise<string>>()
+      .mockRejectedValueOnce(new Error("boom"))
+      .mockResolvedValueOnce("ok");
+    await expect(cachedCall("k", 1000, WAIT, call)).rejects.toThrow("boom");
+    expect(await cachedCall("k", 1000, WAIT, call)).toBe("ok");
+    expect(call).toHaveBeenCalledTimes(2);
+  });
+
+  it("remembers a deterministic 4xx rejection for the short negative TTL", async () => {
+    vi.useFakeTimers();
+    const rejection = new DjangoBadRequestError({
+      path: "/api/v3/search/",
+      method: "POST",
+      body: '{"detail":"bad"}',
+    });
+    const call = vi
+      .fn<() => Promise<string>>()
+      .mockRejectedValueOnce(rejection)
+      .mockResolvedValueOnce("ok");
+    await expect(cachedCall("k", 600_000, WAIT, call)).rejects.toBe(rejection);
+    await expect(cachedCall("k", 600_000, WAIT, call)).rejects.toBe(rejection);
+    expect(call).toHaveBeenCalledTimes(1);
+    vi.advanceTimersByTime(NEGATIVE_CACHE_MAX_TTL_MS + 1);
+    expect(await cachedCall("k", 600_000, WAIT, call)).toBe("ok");
+    expect(call).toHaveBeenCalledTimes(2);
+  });
+
+  it("never remembers a transient upstream status", async () => {
+    const call = vi
+      .fn<() => Promise<string>>()
+      .mockRejectedValueOnce(
+        new DjangoHttpError({ path: "/p/", method: "POST", status: 503, body: "" }),
+      )
+      .mockResolvedValueOnce("ok");
+    await expect(cachedCall("k", 1000, WAIT, call)).rejects.toBeInstanceOf(DjangoHttpError);
+    expect(await cachedCall("k", 1000, WAIT, call)).toBe("ok");
+    expect(call).toHaveBeenCalledTimes(2);
+  });
+
+  it("evicts the least-recently-used entry at the ceiling", async () => {
+    for (let i = 0; i < RESPONSE_CACHE_MAX_ENTRIES; i++) {
+      await cachedCall(`k${i}`, 60_000, WAIT, async () => i);
+    }
+    // Touch k0 so k1 becomes the oldest.
+    await cachedCall("k0", 60_000, WAIT, async () => -1);
+    await cachedCall("overflow", 60_000, WAIT, async () => 0);
+    expect(__response_cache_test_only__.size()).toBe(RESPONSE_CACHE_MAX_ENTRIES);
+    expect(await cachedCall("k0", 60_000, WAIT, async () => -1)).toBe(0);
+    expect(await cachedCall("k1", 60_000, WAIT, async () => -1)).toBe(-1);
+  });
+});
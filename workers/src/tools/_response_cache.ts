@@ -0,0 +1,208 @@
+/**
+ * Per-isolate TTL cache for idempotent Django reads.
+ *
+ * Agent loops re-issue the same search many times in a short window — the
+ * per-entity fan-out `SERVER_INSTRUCTIONS` encourages produces exact
+ * repeats — and every repeat used to pay the full `/api/v3/search/` (or
+ * `/api/v1/answer/`) round trip (seconds, and a metered call). A Worker
+ * isolate serves many invocations while warm, so a small module-scope map
+ * turns a repeat inside the TTL into a lookup. The free graph lookups
+ * (`tako_graph_*`, and the `tako_available_data` pipeline built on them)
+ * ride the same cache: they are cheap per call but are re-issued
+ * constantly while an agent grounds a query.
+ *
+ * Off unless `SEARCH_CACHE_TTL_SECONDS` is set: a stale hit is a behavior
+ * change (a freshly published card would not show up until the entry
+ * expires), so each environment opts in deliberately. When on, concurrent
+ * identical misses share one upstream call instead of racing to fill the
+ * same entry.
+ *
+ * A joiner never waits on the shared call longer than its own call could
+ * have taken (`joinWaitMs`). The in-flight promise is module scope, shared
+ * across invocations, and an invocation the runtime cancels (the client
+ * went away) never settles its fetch chain — without the bound, every later
+ * identical call would join that dead promise and hang for the life of the
+ * isolate. A joiner that outwaits the bound evicts the entry and runs the
+ * call itself.
+ *
+ * The key always carries the caller's token, so one user's results are
+ * never served to another. Cached values are the RAW wire payload and are
+ * shared by reference between hits — callers must treat them as read-only
+ * (every tool safeParses the payload first, and zod returns fresh objects,
+ * so the mapping code downstream never touches the cached value).
+ *
+ * Successes are cached for the full TTL. Failures are not, with one
+ * exception: a deterministic client rejection (see `NEGATIVE_CACHE_STATUS`)
+ * is remembered for a much shorter window, because an agent that loops on
+ * a request Django has already refused would otherwise re-send it verbatim
+ * on every turn. Any other failure rejects every caller that joined the
+ * in-flight call and leaves nothing behind, so the next call retries.
+ */
+import { DjangoError } from "../django.js";
+import type { Env } from "../env.js";
+
+/**
+ * Entry ceiling per isolate. Search payloads are tens of KB, so 256
+ * entries stays well inside a Worker's 128 MB while covering any realistic
+ * agent loop. Eviction is least-recently-used (see `cachedCall`).
+ */
+export const RESPONSE_CACHE_MAX_ENTRIES = 256;
+
+/**
+ * Ceiling on how long a remembered rejection lives, whatever the positive
+ * TTL. Long enough to absorb an agent's tight retry loop, short enough that
+ * a backend fix (a newly deployed enum value, a restored card) shows up on
+ * the next turn.
+ */
+export const NEGATIVE_CACHE_MAX_TTL_MS = 30_000;
+
+/**
+ * Statuses that answer the REQUEST rather than the moment: the same body
+ * with the same token gets the same refusal. 401 is excluded because it
+ * usually means a token that is about to be refreshed, and 408/429 and
+ * every 5xx are transient — the tool errors tell the model to retry those,
+ * so caching them would make the advertised retry fail by construction.
+ */
+const NEGATIVE_CACHE_STATUS = new Set([400, 403, 404, 422]);
+
+interface CacheEntry {
+  value: unknown;
+  expiresAt: number;
+  /** Set when `value` is a remembered rejection to re-throw on a hit. */
+  failed?: true;
+}
+
+// Map iteration order is insertion order, so re-inserting on every hit keeps
+// the least-recently-used entry first — eviction is `keys().next()`.
+const settled = new Map<string, CacheEntry>();
+const inFlight = new Map<string, Promise<unknown>>();
+
+/** What {@link joinWithin} resolves to when the shared call outlived the wait. */
+const JOIN_TIMED_OUT = Symbol("join-timed-out");
+
+/**
+ * The cache TTL in milliseconds from `SEARCH_CACHE_TTL_SECONDS`, or 0
+ * (disabled) when unset, empty, non-numeric, or not positive. Malformed
+ * values disable rather than throw: a typo in a var must never take the
+ * tool down.
+ */
+export function responseCacheTtlMs(env: Env): number {
+  const raw = env.SEARCH_CACHE_TTL_SECONDS;
+  if (raw === undefined || raw === "") return 0;
+  const seconds = Number(raw);
+  if (!Number.isFinite(seconds) || seconds <= 0) return 0;
+  return seconds * 1000;
+}
+
+/**
+ * Cache key for one Django call, over the request body's JSON text — the
+ * same string the caller sends (`djangoPostJson`), so the body is
+ * serialized once per call. NUL separators cannot appear in a token, a
+ * path, or JSON text, so distinct triples never collide.
+ */
+export function responseCacheKey(token: string, path: string, json: string): string {
+  return `${path}\u0000${token}\u0000${json}`;
+}
+
+/**
+ * Run `call` through the cache. `ttlMs <= 0` bypasses everything, which
+ * keeps the disabled path identical to calling `call` directly.
+ *
+ * `joinWaitMs` bounds how long this caller waits on an identical call that
+ * is already in flight — pass the upstream timeout `call` itself uses, so
+ * joining is never slower than not joining (see the module doc).
+ */
+export async function cachedCall<T>(
+  key: string,
+  ttlMs: number,
+  joinWaitMs: number,
+  call: () => Promise<T>,
+): Promise<T> {
+  if (ttlMs <= 0) return call();
+
+  const hit = settled.get(key);
+  if (hit !== undefined) {
+    settled.delete(key);
+    if (hit.expiresAt > Date.now()) {
+      settled.set(key, hit);
+      if (hit.failed === true) throw hit.value;
+      return hit.value as T;
+    }
+  }
+
+  const pending = inFlight.get(key);
+  if (pending !== undefined) {
+    const joined = await joinWithin(pending, joinWaitMs);
+    if (joined !== JOIN_TIMED_OUT) return joined as T;
+    // The shared call outlived any call this caller could have made: treat
+    // it as dead. It may still land later; `forget` below only ever clears
+    // its own entry, so it cannot evict the call started here.
+    if (inFlight.get(key) === pending) inFlight.delete(key);
+    return cachedCall(key, ttlMs, joinWaitMs, call);
+  }
+
+  const started = settle(key, ttlMs, call);
+  inFlight.set(key, started);
+  const forget = () => {
+    if (inFlight.get(key) === started) inFlight.delete(key);
+  };
+  started.then(forget, forget);
+  return started;
+}
+
+/** Run `call` and record its outcome: a success, or a deterministic rejection. */
+async function settle<T>(key: string, ttlMs: number, call: () => Promise<T>): Promise<T> {
+  try {
+    const value = await call();
+    remember(key, { value, expiresAt: Date.now() + ttlMs });
+    return value;
+  } catch (err) {
+    if (
+      err instanceof DjangoError &&
+      err.status !== undefined &&
+      NEGATIVE_CACHE_STATUS.has(err.status)
+    ) {
+      remember(key, {
+        value: err,
+        expiresAt: Date.now() + Math.min(ttlMs, NEGATIVE_CACHE_MAX_TTL_MS),
+        failed: true,
+      });
+    }
+    throw err;
+  }
+}
+
+/** `pending`'s outcome, or `JOIN_TIMED_OUT` if it has not settled within `ms`. */
+async function joinWithin(
+  pending: Promise<unknown>,
+  ms: number,
+): Promise<unknown> {
+  let timer: ReturnType<typeof setTimeout> | undefined;
+  const timedOut = new Promise<typeof JOIN_TIMED_OUT>((resolve) => {
+    timer = setTimeout(() => resolve(JOIN_TIMED_OUT), ms);
+  });
+  try {
+    return await Promise.race([pending, timedOut]);
+  } finally {
+    clearTimeout(timer);
+  }
+}
+
+function remember(key: string, entry: CacheEntry): void {
+  if (settled.size >= RESPONSE_CACHE_MAX_ENTRIES) {
+    const oldest = settled.keys().next();
+    if (oldest.done !== true) settled.delete(oldest.value);
+  }
+  settled.set(key, entry);
+}
+
+/** Test-only handle: clears both maps so suites never see each other's entries. */
+export const __response_cache_test_only__ = {
+  reset(): void {
+    settled.clear();
+    inFlight.clear();
+  },
+  size(): number {
+    return settled.size;
+  },
+};
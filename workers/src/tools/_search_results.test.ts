@@ -628,6 +628,15 @@ const seriesCard = (
   }) as TakoCard;
 
 describe("orderCardsByUsefulness", () => {
+  it("returns zero or one card as a fresh copy without reordering", () => {
+    const only = seriesCard("only", "2026-06-01T00:00:00+00:00");
+    const input = [only];
+    const out = orderCardsByUsefulness(input);
+    expect(out).toEqual([only]);
+    expect(out).not.toBe(input);
+    expect(orderCardsByUsefulness([])).toEqual([]);
+  });
+
   it("puts the fresher series first (the live stale-top-card failure)", () => {
     const stale = seriesCard("annual", "2024-01-01T00:00:00+00:00");
     const fresh = seriesCard("cpi_sa", "2026-06-01T00:00:00+00:00");
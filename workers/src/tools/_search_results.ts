@@ -508,6 +508,12 @@ function valuesHint(card: TakoCard): string {
 // out of the card would cost more glossary overhead than it saves.
 const GLOSSARY_MIN_CHARS = 120;
 
+// The (array, name, text) triples `hoistSourceGlossary` walks on each card.
+const GLOSSARY_FIELDS = [
+  ["sources", "source_name", "source_description"],
+  ["methodologies", "methodology_name", "methodology_description"],
+] as const;
+
 /**
  * Hoist per-card source/methodology boilerplate into one top-level glossary.
  * The backend repeats the full source paragraph on EVERY card from that
@@ -524,6 +530,8 @@ export function hoistSourceGlossary(cards: TakoCard[]): {
   cards: TakoCard[];
   glossary: Record<string, string> | undefined;
 } {
+  // A miss (zero cards) is common and has nothing to hoist.
+  if (cards.length === 0) return { cards, glossary: undefined };
   const glossary: Record<string, string> = {};
   const hoistArray = (items: unknown, nameKey: string, textKey: string): unknown => {
     if (!Array.isArray(items)) return items;
@@ -548,21 +556,20 @@ export function hoistSourceGlossary(cards: TakoCard[]): {
     });
     return changed ? out : items;
   };
+  // One pass per card, copying it only once something actually moves: most
+  // cards carry no paragraph-length boilerplate, and spreading each of them
+  // up front just to discard the copy was an allocation per card per call.
   const outCards = cards.map((card) => {
     const rec = card as Record<string, unknown>;
-    const next: Record<string, unknown> = { ...rec };
-    let changed = false;
-    for (const [arrayKey, nameKey, textKey] of [
-      ["sources", "source_name", "source_description"],
-      ["methodologies", "methodology_name", "methodology_description"],
-    ] as const) {
+    let next: Record<string, unknown> | undefined;
+    for (const [arrayKey, nameKey, textKey] of GLOSSARY_FIELDS) {
       const hoisted = hoistArray(rec[arrayKey], nameKey, textKey);
       if (hoisted !== rec[arrayKey]) {
+        if (next === undefined) next = { ...rec };
         next[arrayKey] = hoisted;
-        changed = true;
       }
     }
-    return changed ? (next as TakoCard) : card;
+    return next === undefined ? card : (next as TakoCard);
   });
   return {
     cards: outCards,
@@ -962,6 +969,8 @@ function relevanceRank(card: TakoCard): number {
  * pruning.
  */
 export function orderCardsByUsefulness(cards: readonly TakoCard[]): TakoCard[] {
+  // Zero or one card has only one order: skip computing the signals.
+  if (cards.length < 2) return [...cards];
   // Decorate-sort-undecorate: computes each signal once, and makes the sort
   // stable regardless of engine so ties keep the backend's ordering.
   return cards
@@ -4,6 +4,7 @@ vi.mock("../django.js", () => ({ djangoPost: vi.fn(), djangoGet: vi.fn() }));
 import { djangoPost, djangoGet } from "../django.js";
 import tool, { AGENT_POLL_BUDGET_MS, AGENT_WAIT_CEILING_S, buildAgentBody, pollAgentRun } from "./tako_agent.js";
 import { AnswerAgentRunRequest } from "../generated/schemas.js";
+import waitTool from "./tako_agent_wait.js";
 
 const ctx = { token: "t", env: {} as never, client: "claude" as const, sendProgress: vi.fn() };
 
@@ -90,6 +91,18 @@ describe("tako_agent", () => {
     expect(out.error?.message).toBe("boom");
   });
 
+  it("encodes a model-supplied run_id into a single path segment", async () => {
+    // `tako_agent_wait` takes run_id straight from the model: a raw `/` or
+    // `..` would re-route the poll to another endpoint under the caller's key.
+    vi.mocked(djangoGet).mockResolvedValue({
+      run_id: "../x",
+      status: "completed",
+      result: { answer: "a", cards: [] },
+    });
+    await waitTool.handler({ run_id: "../x", max_wait_seconds: 5 }, ctx);
+    expect(vi.mocked(djangoGet).mock.calls[0]![2]).toBe("/api/v1/agent/answer/runs/..%2Fx");
+  });
+
   it("throws when the run never completes before AGENT_POLL_BUDGET_MS (Claude path)", async () => {
     vi.useFakeTimers();
     // Always return "running" — never completes
@@ -231,6 +231,11 @@ export async function pollAgentRun(
   opts: { budgetMs: number; onTimeout: "throw" | "return" },
 ): Promise<AgentRun> {
   const deadline = Date.now() + opts.budgetMs;
+  // Built once per wait, not per poll. Encoded like the graph tools' node ids:
+  // `tako_agent_wait` takes `run_id` straight from the model, and a raw `/`
+  // or `..` segment would otherwise re-route the poll to another endpoint
+  // under the caller's key.
+  const runPath = `/api/v1/agent/answer/runs/${encodeURIComponent(runId)}`;
   let transient = 0;
   let pollCount = 0;
   let lastRun: AgentRun | undefined;
@@ -238,7 +243,7 @@ export async function pollAgentRun(
   while (true) {
     let wire: AgentRunWire;
     try {
-      wire = await djangoGet<AgentRunWire>(ctx.env, ctx.token, `/api/v1/agent/answer/runs/${runId}`, {
+      wire = await djangoGet<AgentRunWire>(ctx.env, ctx.token, runPath, {
         timeoutMs: AGENT_POLL_REQUEST_TIMEOUT_MS,
       });
       transient = 0;
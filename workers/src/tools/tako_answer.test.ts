@@ -20,6 +20,7 @@ import takoAnswer, { buildAnswerBody } from "./tako_answer.js";
 import takoSearch from "./tako_search.js";
 import { APP_UI_RESOURCE_URI } from "./_chart_widget.js";
 import { SearchRequest } from "../generated/schemas.js";
+import { __response_cache_test_only__ } from "./_response_cache.js";
 import {
   bodyOf,
   jsonResponse,
@@ -64,6 +65,7 @@ const FULL_RESPONSE = {
 afterEach(() => {
   vi.unstubAllGlobals();
   vi.restoreAllMocks();
+  __response_cache_test_only__.reset();
 });
 
 // Regression: same root cause as the tako_search content-shape outage — cards
@@ -179,6 +181,28 @@ describe("tako_answer handler", () => {
     expect(out.request_id).toBe("req-2");
   });
 
+  it("shares one POST between concurrent identical calls when the TTL is on, per token", async () => {
+    const cached: ToolContext = { ...CTX, env: { ...ENV, SEARCH_CACHE_TTL_SECONDS: "60" } };
+    const fetchMock = mockFetchSequence([
+      jsonResponse(200, { answer: "Shared.", request_id: "req-a" }),
+      jsonResponse(200, { answer: "Other user.", request_id: "req-b" }),
+    ]);
+    const input: Parameters<typeof takoAnswer.handler>[0] = { query: "US GDP", sources: ["tako"], include_contents: false, preview_rows: 50, country_code: "US", locale: "en-US", strict: false };
+
+    const [first, second] = await Promise.all([
+      takoAnswer.handler(input, cached),
+      takoAnswer.handler(input, cached),
+    ]);
+    expect(fetchMock).toHaveBeenCalledTimes(1);
+    expect(first.answer).toBe("Shared.");
+    expect(second.answer).toBe("Shared.");
+
+    const other = await takoAnswer.handler(input, { ...cached, token: "sk-other" });
+    expect(fetchMock).toHaveBeenCalledTimes(2);
+    expect(other.answer).toBe("Other user.");
+    expect(requestFrom(fetchMock.mock.calls[1]).headers.get("x-api-key")).toBe("sk-other");
+  });
+
   it("output does NOT contain grounding-era fields (tako_selected, confidence)", async () => {
     mockFetchSequence([jsonResponse(200, FULL_RESPONSE)]);
 
@@ -1,6 +1,6 @@
 import { z } from "zod";
 
-import { djangoPost } from "../django.js";
+import { djangoPostJson } from "../django.js";
 import { AnswerResponse, SearchRequest } from "../generated/schemas.js";
 import { looseArray } from "./_loose_array.js";
 import { logWireGuardFailure } from "./_log.js";
@@ -10,6 +10,7 @@ import {
   slimAnswerStructured,
   type AnswerFullOutput,
 } from "./_render_markdown.js";
+import { cachedCall, responseCacheKey, responseCacheTtlMs } from "./_response_cache.js";
 import {
   buildChartAppUiResourceFromOutputPubId,
   buildChartExtraMeta,
@@ -169,6 +170,16 @@ const outputSchema = answerSlimOutputShape;
 
 type Output = z.infer<typeof outputSchema>;
 
+/**
+ * The `sources.web` block every answer sends — no field depends on the
+ * input, so it is built once and shared. Frozen because it rides by
+ * reference in each request body (and in cache keys); nothing downstream
+ * may mutate it.
+ */
+const ANSWER_WEB_SOURCE: NonNullable<
+  NonNullable<z.input<typeof SearchRequest>["sources"]>["web"]
+> = Object.freeze({ include_contents: false, snippet_max_chars: 2000, highlights: true });
+
 /**
  * Reshape the flat MCP input into the backend's nested SearchRequest body.
  * Exported for the contract-guard test.
@@ -212,7 +223,7 @@ export function buildAnswerBody(input: Input): z.input<typeof SearchRequest> {
   //    budget whose breach drops web grounding entirely rather than
   //    returning it late. A rise in ungrounded answers points here first.
   if (input.sources.includes("web")) {
-    sources.web = { include_contents: false, snippet_max_chars: 2000, highlights: true };
+    sources.web = ANSWER_WEB_SOURCE;
   }
   // No `effort`/per-source `count` (unlike buildSearchBody): answer is
   // fast-pipeline + arbiter only, with no async/deep path (see handler).
@@ -277,7 +288,16 @@ const takoAnswer = {
     // No per-source `count` (answer exposes none): each source defaults to the
     // backend's count (5) — intentional, unlike tako_search which sends 10.
     const body = buildAnswerBody(input);
-    const data = await djangoPost<unknown>(ctx.env, ctx.token, "/api/v1/answer/", body, { timeoutMs: 130_000 });
+    // An answer is the costliest call on the surface (search + arbiter), so
+    // it shares tako_search's opt-in per-isolate cache — a repeat of the same
+    // question inside the TTL is a lookup (see `_response_cache.ts`).
+    const json = JSON.stringify(body);
+    const data = await cachedCall(
+      responseCacheKey(ctx.token, "/api/v1/answer/", json),
+      responseCacheTtlMs(ctx.env),
+      130_000,
+      () => djangoPostJson<unknown>(ctx.env, ctx.token, "/api/v1/answer/", json, { timeoutMs: 130_000 }),
+    );
 
     // Wire-contract guard: validate against the generated AnswerResponse before
     // mapping into the normalised MCP output shape.
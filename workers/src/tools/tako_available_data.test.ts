@@ -3,6 +3,7 @@ import { afterEach, describe, expect, it, vi } from "vitest";
 import type { Env } from "../env.js";
 import type { ToolContext } from "./types.js";
 import { MAX_COVERAGE_NAMES, MAX_COVERAGE_PAGES, PAGE_LIMIT } from "./_available_data.js";
+import { __response_cache_test_only__ } from "./_response_cache.js";
 import takoAvailableData from "./tako_available_data.js";
 import {
   jsonResponse,
@@ -63,6 +64,7 @@ const pairPage = (
 afterEach(() => {
   vi.unstubAllGlobals();
   vi.restoreAllMocks();
+  __response_cache_test_only__.reset();
 });
 
 describe("tako_available_data", () => {
@@ -79,6 +81,32 @@ describe("tako_available_data", () => {
     expect(out.summary).toContain("no data-graph node");
   });
 
+  it("serves a repeat inside the opt-in TTL from the cache, keyed per token", async () => {
+    const cached: ToolContext = { ...CTX, env: { ...ENV, SEARCH_CACHE_TTL_SECONDS: "60" } };
+    const pipeline = () => [
+      jsonResponse(200, {
+        results: [searchHit("apple-inc", "Apple Inc."), searchHit("apple-records", "Apple Records")],
+      }),
+      jsonResponse(200, drill("apple-inc", "Apple Inc.", "metrics", ["Revenue"], 1)),
+      jsonResponse(200, drill("apple-records", "Apple Records", "metrics", ["X"], 5)),
+    ];
+    const fetchMock = mockFetchSequence([...pipeline(), ...pipeline()]);
+
+    const first = await takoAvailableData.handler({ q: "apple" }, cached);
+    // 1 search + 1 full drill + 1 selection probe.
+    const calls = 3;
+    expect(fetchMock.mock.calls).toHaveLength(calls);
+    // Same token, same query: every graph read is a lookup.
+    expect(await takoAvailableData.handler({ q: "apple" }, cached)).toEqual(first);
+    expect(fetchMock.mock.calls).toHaveLength(calls);
+    // Another token never sees those entries: the whole pipeline refetches.
+    await takoAvailableData.handler({ q: "apple" }, { ...cached, token: "sk-other" });
+    expect(fetchMock.mock.calls).toHaveLength(calls * 2);
+    for (const call of fetchMock.mock.calls.slice(calls)) {
+      expect(requestFrom(call).headers.get("x-api-key")).toBe("sk-other");
+    }
+  });
+
   it("forwards q + limit + optional types/label to graph/search", async () => {
     const fetchMock = mockFetchSequence([jsonResponse(200, { results: [] })]);
     await takoAvailableData.handler({ q: "apple", types: "entity", label: "ORG" }, CTX);
@@ -64,6 +64,7 @@ import {
 } from "./_render_markdown.js";
 import type { graphNodeSchema, graphRelationSchema } from "./_graph.js";
 import { logWireGuardFailure } from "./_log.js";
+import { cachedCall, responseCacheKey, responseCacheTtlMs } from "./_response_cache.js";
 import type { ToolModule } from "./types.js";
 
 /** One drilled coverage page (graph/related's `relation` group). */
@@ -227,6 +228,27 @@ const tako_available_data = {
   // Declared as the FULL internal shape (assignable to the slim advertised
   // Output via its loose index signature) so tests and hooks keep real types.
   async handler(input: Input, ctx): Promise<FullOutput> {
+    // Every graph read below goes through the shared per-isolate response
+    // cache (see `_response_cache.ts`), the same one the standalone
+    // `tako_graph_*` tools use. This pipeline is the compound discovery call
+    // agents re-issue while grounding a query, so with the opt-in TTL on a
+    // repeat is a lookup, and identical reads in flight at once share a
+    // single round trip. Disabled, every read is a plain GET, exactly as
+    // before. Each read keys on the caller's token, path and query, like the
+    // standalone tools.
+    const ttlMs = responseCacheTtlMs(ctx.env);
+    const graphGet = (
+      path: string,
+      query: Record<string, string | number | boolean>,
+      timeoutMs: number,
+    ): Promise<unknown> =>
+      cachedCall(
+        responseCacheKey(ctx.token, path, JSON.stringify(query)),
+        ttlMs,
+        timeoutMs,
+        () => djangoGet<unknown>(ctx.env, ctx.token, path, { query, timeoutMs }),
+      );
+
     // One `graph/search` probe. Extracted because the LOOKUP path runs two of
     // them (entity + metric) in parallel; the discovery path runs one.
     //
@@ -252,10 +274,7 @@ const tako_available_data = {
 
       let raw: unknown;
       try {
-        raw = await djangoGet<unknown>(
-          ctx.env, ctx.token, "/api/beta/graph/search",
-          { query, timeoutMs: 15_000 },
-        );
+        raw = await graphGet("/api/beta/graph/search", query, 15_000);
       } catch (err) {
         // Log the original transport error — wrapping in a plain Error below
         // drops the DjangoError envelope, so this line is the only server-side
@@ -296,7 +315,7 @@ const tako_available_data = {
           const relation = coverageKindFor(node.type);
           try {
             let group: GraphRelationPage | null = null;
-            let items: GraphRelationPage["items"] = [];
+            const items: GraphRelationPage["items"] = [];
             let cursor: string | null = null;
             let pages = 0;
             do {
@@ -306,10 +325,7 @@ const tako_available_data = {
               if (cursor !== null) relatedQuery.cursor = cursor;
               let relatedRaw: unknown;
               try {
-                relatedRaw = await djangoGet<unknown>(
-                  ctx.env, ctx.token, "/api/beta/graph/related",
-                  { query: relatedQuery, timeoutMs: 15_000 },
-                );
+                relatedRaw = await graphGet("/api/beta/graph/related", relatedQuery, 15_000);
               } catch (pageErr) {
                 if (group !== null) {
                   // Pages already in hand — return them rather than degrading
@@ -340,7 +356,9 @@ const tako_available_data = {
                 break;
               }
               pages += 1;
-              items = [...items, ...page.items];
+              // Append in place: re-spreading the accumulated list on every
+              // page copied it once per page (quadratic in the page count).
+              items.push(...page.items);
               group = page;
               const next = page.next_cursor ?? null;
               // Terminate on a page that makes no forward progress (empty items
@@ -369,9 +387,10 @@ const tako_available_data = {
       node: GraphNode,
     ): Promise<{ node: GraphNode; total: number; capped: boolean }> => {
       try {
-        const raw = await djangoGet<unknown>(
-          ctx.env, ctx.token, "/api/beta/graph/related",
-          { query: { node_id: node.id, relation: coverageKindFor(node.type), limit: 1 }, timeoutMs: 15_000 },
+        const raw = await graphGet(
+          "/api/beta/graph/related",
+          { node_id: node.id, relation: coverageKindFor(node.type), limit: 1 },
+          15_000,
         );
         const parsed = relatedShape.safeParse(raw);
         return {
@@ -417,15 +436,10 @@ const tako_available_data = {
     ): Promise<{ items: GraphNode[]; complete: boolean } | null> => {
       if (filter === null) return null;
       try {
-        const raw = await djangoGet<unknown>(
-          ctx.env, ctx.token, "/api/beta/graph/related",
-          {
-            query: {
-              node_id: entityNodeId, relation: "metrics",
-              q: filter, limit: PAIR_PROBE_LIMIT,
-            },
-            timeoutMs: PAIR_PROBE_TIMEOUT_MS,
-          },
+        const raw = await graphGet(
+          "/api/beta/graph/related",
+          { node_id: entityNodeId, relation: "metrics", q: filter, limit: PAIR_PROBE_LIMIT },
+          PAIR_PROBE_TIMEOUT_MS,
         );
         const parsed = relatedShape.safeParse(raw);
         if (!parsed.success) {
@@ -880,6 +894,7 @@ const tako_available_data = {
     }
 
     const renderedIds = new Set(rendered.map((n) => n.id));
+    const keptNodes = new Set(gate.kept);
     const other_matches: OtherMatch[] = [
       // Displaced from the full render by a better-covered candidate. First,
       // because it is what the backend ranked highest — a caller who wanted it
@@ -895,10 +910,11 @@ const tako_available_data = {
           coverage_total: pr.total,
           coverage_capped: pr.capped,
         })),
-      // Never inspected: name only.
+      // Never inspected: name only. Set membership, not `kept.includes` per
+      // result — the gate's output is a subset of `results` by identity.
       ...gate.kept
         .slice(SELECT_TOP_N)
-        .concat(results.filter((n) => !gate.kept.includes(n)))
+        .concat(results.filter((n) => !keptNodes.has(n)))
         .map((n) => ({ name: n.name, type: n.type })),
     ];
 
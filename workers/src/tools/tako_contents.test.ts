@@ -11,7 +11,7 @@ vi.mock("../django.js", async (importOriginal) => ({
 
 import { DjangoError, DjangoHttpError, DjangoNotFoundError, DjangoUnauthorizedError, djangoPost } from "../django.js";
 import { djangoErrorToToolResult } from "../mcp.js";
-import tool, { BATCH_CHAR_BUDGET, MAX_CONTENTS_URLS } from "./tako_contents.js";
+import tool, { BATCH_CHAR_BUDGET, CONTENTS_FETCH_CONCURRENCY, MAX_CONTENTS_URLS } from "./tako_contents.js";
 
 const ctx = { token: "t", env: {} as never, client: "claude" as const, sendProgress: vi.fn() };
 
@@ -97,6 +97,51 @@ describe("tako_contents handler", () => {
     expect(out.cost).toBeCloseTo(0.03);
   });
 
+  it("fetches a repeated url once, keeps positions, and bills it once", async () => {
+    vi.mocked(djangoPost)
+      .mockResolvedValueOnce(item("page A"))
+      .mockResolvedValueOnce(item("page B"));
+    const out = await tool.handler(
+      { urls: ["https://a", "https://b", "https://a"], ...CALL },
+      ctx,
+    );
+    expect(vi.mocked(djangoPost)).toHaveBeenCalledTimes(2);
+    expect(out.results.map((r) => r.url)).toEqual(["https://a", "https://b", "https://a"]);
+    expect(out.results.map((r) => r.data)).toEqual(["page A", "page B", "page A"]);
+    expect(out.results[2]?.cost).toBe(0);
+    expect(out.cost).toBeCloseTo(0.02);
+  });
+
+  it("keeps a duplicate-heavy default batch inside BATCH_CHAR_BUDGET", async () => {
+    vi.spyOn(console, "warn").mockImplementation(() => undefined);
+    // The backend fills whatever cap it is sent, so the total returned is
+    // exactly what the derived cap allows.
+    vi.mocked(djangoPost).mockImplementation(async (_env, _token, _path, body) =>
+      item("x".repeat((body as { max_chars: number }).max_chars)) as never,
+    );
+    const urls = [...Array.from({ length: 9 }, () => "https://a"), "https://b"];
+    const out = await tool.handler({ urls, mode: "inline", content_format: "csv" }, ctx);
+    expect(vi.mocked(djangoPost)).toHaveBeenCalledTimes(2);
+    const total = out.results.reduce((sum, r) => sum + (r.data?.length ?? 0), 0);
+    expect(total).toBeLessThanOrEqual(BATCH_CHAR_BUDGET);
+  });
+
+  it("keeps at most CONTENTS_FETCH_CONCURRENCY fetches in flight, in url order", async () => {
+    let inFlight = 0;
+    let peak = 0;
+    vi.mocked(djangoPost).mockImplementation(async (_env, _token, _path, body) => {
+      inFlight++;
+      peak = Math.max(peak, inFlight);
+      await new Promise((r) => setTimeout(r, 0));
+      inFlight--;
+      return item(`page ${(body as { url: string }).url}`) as never;
+    });
+    const urls = Array.from({ length: MAX_CONTENTS_URLS }, (_, i) => `https://u${i}`);
+    const out = await tool.handler({ urls, ...CALL }, ctx);
+    expect(peak).toBe(CONTENTS_FETCH_CONCURRENCY);
+    expect(out.results.map((r) => r.data)).toEqual(urls.map((u) => `page ${u}`));
+  });
+
   it("one url failing does NOT discard the others; its entry carries the guidance", async () => {
     const gated = new DjangoHttpError({ path: "/api/v1/contents/", method: "POST", status: 403, body: "forbidden" });
     vi.mocked(djangoPost)
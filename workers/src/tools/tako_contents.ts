@@ -99,6 +99,42 @@ export const MAX_CONTENTS_URLS = 10;
  */
 export const BATCH_CHAR_BUDGET = 250_000;
 
+/**
+ * How many of a batch's subrequests are in flight at once. The Workers
+ * runtime allows six simultaneous open connections per invocation and
+ * quietly queues the rest — but a queued fetch's 60s timeout is already
+ * running while it waits for a slot, so the tail of a 10-URL batch could
+ * time out having spent most of its budget in the runtime's queue. Keeping
+ * our own limit at the runtime's means every fetch starts its clock when it
+ * actually starts.
+ */
+export const CONTENTS_FETCH_CONCURRENCY = 6;
+
+/**
+ * `Promise.allSettled(items.map(fn))` with at most `limit` calls pending at
+ * once. Results keep `items` order.
+ */
+async function allSettledBounded<T, R>(
+  items: readonly T[],
+  limit: number,
+  fn: (item: T) => Promise<R>,
+): Promise<PromiseSettledResult<R>[]> {
+  const results = new Array<PromiseSettledResult<R>>(items.length);
+  let next = 0;
+  const worker = async (): Promise<void> => {
+    while (next < items.length) {
+      const i = next++;
+      try {
+        results[i] = { status: "fulfilled", value: await fn(items[i]!) };
+      } catch (reason) {
+        results[i] = { status: "rejected", reason };
+      }
+    }
+  };
+  await Promise.all(Array.from({ length: Math.min(limit, items.length) }, worker));
+  return results;
+}
+
 const inputSchema = ContentsRequest.pick({ url: true }).extend({
   // looseArray: a host that sends one URL as a bare string, or the array as
   // JSON text, gets it coerced instead of a -32602. Deliberately NOT
@@ -492,14 +528,35 @@ const takoContents = {
       );
     }
     // Fan out: the backend takes ONE url per request, so a batch is N
-    // subrequests issued concurrently. allSettled, not all — one URL's 403
+    // subrequests issued concurrently (at most `CONTENTS_FETCH_CONCURRENCY`
+    // at a time). allSettled, not all — one URL's 403
     // (a license-gated card) must not discard the pages that did resolve.
-    const settled = await Promise.allSettled(
-      targets.map((u) => fetchOne(u, input, ctx, targets.length)),
+    //
+    // Repeated URLs are fetched ONCE. Models do paste the same URL twice
+    // into one batch, and each copy was a separate billed subrequest for an
+    // identical payload. Positions are kept (results stay aligned with
+    // `urls`); a repeat carries the first copy's result at cost 0, since it
+    // was not billed again, so the envelope sum stays truthful.
+    //
+    // The per-URL cap still divides by `targets.length`, NOT the distinct
+    // count: every repeated position carries the full payload again, so
+    // dividing by fewer URLs would let `[a×9, b]` return ~1M chars — the
+    // exact blowup `BATCH_CHAR_BUDGET` exists to prevent.
+    const distinct = [...new Set(targets)];
+    const settled = await allSettledBounded(distinct, CONTENTS_FETCH_CONCURRENCY, (u) =>
+      fetchOne(u, input, ctx, targets.length),
     );
-    const results = settled.map((s, i) => {
-      const url = targets[i] as string;
-      if (s.status === "fulfilled") return { ...s.value, url };
+    const byUrl = new Map(distinct.map((u, i) => [u, settled[i]!]));
+    // `delete` reports whether the url was still unclaimed, so the first
+    // occurrence claims it and every later one reads as a repeat — one Set
+    // operation per position instead of a `has` + `add` pair.
+    const unclaimed = new Set(distinct);
+    const results = targets.map((url) => {
+      const s = byUrl.get(url)!;
+      const repeat = !unclaimed.delete(url);
+      if (s.status === "fulfilled") {
+        return repeat ? { ...s.value, url, cost: 0 } : { ...s.value, url };
+      }
       return { url, cost: 0, error: errorText(s.reason) };
     });
     // Every URL failed: there is no partial payload worth returning, so
@@ -2,6 +2,7 @@ import { afterEach, describe, expect, it, vi } from "vitest";
 
 import type { Env } from "../env.js";
 import type { ToolContext } from "./types.js";
+import { __response_cache_test_only__ } from "./_response_cache.js";
 import takoGraphNode from "./tako_graph_node.js";
 import {
   jsonResponse,
@@ -24,6 +25,7 @@ const NODE = {
 afterEach(() => {
   vi.unstubAllGlobals();
   vi.restoreAllMocks();
+  __response_cache_test_only__.reset();
 });
 
 describe("tako_graph_node", () => {
@@ -40,6 +42,19 @@ describe("tako_graph_node", () => {
     expect(out.aliases).toEqual(["TSLA"]);
   });
 
+  it("serves a repeat inside the opt-in TTL from the cache, keyed per token", async () => {
+    const cached: ToolContext = { ...CTX, env: { ...ENV, SEARCH_CACHE_TTL_SECONDS: "60" } };
+    const fetchMock = mockFetchSequence([jsonResponse(200, NODE), jsonResponse(200, NODE)]);
+
+    const first = await takoGraphNode.handler({ id: "tesla-x1" }, cached);
+    expect(await takoGraphNode.handler({ id: "tesla-x1" }, cached)).toEqual(first);
+    expect(fetchMock).toHaveBeenCalledTimes(1);
+
+    await takoGraphNode.handler({ id: "tesla-x1" }, { ...cached, token: "sk-other" });
+    expect(fetchMock).toHaveBeenCalledTimes(2);
+    expect(requestFrom(fetchMock.mock.calls[1]).headers.get("X-API-Key")).toBe("sk-other");
+  });
+
   it("rejects an empty id", () => {
     expect(() => takoGraphNode.inputSchema.parse({ id: "" })).toThrow();
   });
@@ -11,6 +11,7 @@ import { z } from "zod";
 import { djangoGet } from "../django.js";
 import { graphErrorMessage, graphNodeSchema } from "./_graph.js";
 import { logWireGuardFailure } from "./_log.js";
+import { cachedCall, responseCacheKey, responseCacheTtlMs } from "./_response_cache.js";
 import type { ToolModule } from "./types.js";
 
 const DESCRIPTION =
@@ -46,9 +47,14 @@ const tako_graph_node = {
     const path = `/api/beta/graph/node/${encodeURIComponent(input.id)}`;
     let data: unknown;
     try {
-      data = await djangoGet<unknown>(ctx.env, ctx.token, path, {
-        timeoutMs: 15_000,
-      });
+      // Idempotent read: shares the per-isolate response cache (see
+      // `_response_cache.ts`); the id is in the path, so no body to key on.
+      data = await cachedCall(
+        responseCacheKey(ctx.token, path, ""),
+        responseCacheTtlMs(ctx.env),
+        15_000,
+        () => djangoGet<unknown>(ctx.env, ctx.token, path, { timeoutMs: 15_000 }),
+      );
     } catch (err) {
       // Log before wrapping: the plain-Error wrap drops the DjangoError
       // envelope, so this is the only server-side record of the failure.
@@ -2,6 +2,7 @@ import { afterEach, describe, expect, it, vi } from "vitest";
 
 import type { Env } from "../env.js";
 import type { ToolContext } from "./types.js";
+import { __response_cache_test_only__ } from "./_response_cache.js";
 import takoGraphRelated from "./tako_graph_related.js";
 import {
   jsonResponse,
@@ -28,6 +29,7 @@ const metricsPage = (items: { id: string; name: string }[], capped = false) => (
 afterEach(() => {
   vi.unstubAllGlobals();
   vi.restoreAllMocks();
+  __response_cache_test_only__.reset();
 });
 
 describe("tako_graph_related", () => {
@@ -47,6 +49,28 @@ describe("tako_graph_related", () => {
     expect(url.searchParams.has("relation")).toBe(false);
   });
 
+  it("caches each page separately inside the opt-in TTL", async () => {
+    const cached: ToolContext = { ...CTX, env: { ...ENV, SEARCH_CACHE_TTL_SECONDS: "60" } };
+    const fetchMock = mockFetchSequence([
+      jsonResponse(200, metricsPage([{ id: "m1", name: "Revenue" }])),
+      jsonResponse(200, metricsPage([{ id: "m2", name: "Net Income" }])),
+    ]);
+
+    const page1 = await takoGraphRelated.handler(
+      { node_id: "tesla-x1", relation: "metrics", cursor: "c1" }, cached,
+    );
+    const page2 = await takoGraphRelated.handler(
+      { node_id: "tesla-x1", relation: "metrics", cursor: "c2" }, cached,
+    );
+    expect(fetchMock).toHaveBeenCalledTimes(2);
+    expect(page2).not.toEqual(page1);
+    // A repeat of the first page is a lookup.
+    expect(
+      await takoGraphRelated.handler({ node_id: "tesla-x1", relation: "metrics", cursor: "c1" }, cached),
+    ).toEqual(page1);
+    expect(fetchMock).toHaveBeenCalledTimes(2);
+  });
+
   it("forwards cursor/limit/label/infer_label as query params", async () => {
     const fetchMock = mockFetchSequence([
       jsonResponse(200, { node: hub, relation: { key: "metrics", kind: "data", label: "Metrics", items: [], total: 0, total_capped: false, next_cursor: null } }),
@@ -13,6 +13,7 @@ import { z } from "zod";
 import { djangoGet } from "../django.js";
 import { graphErrorMessage, graphRelatedOutputShape } from "./_graph.js";
 import { logWireGuardFailure } from "./_log.js";
+import { cachedCall, responseCacheKey, responseCacheTtlMs } from "./_response_cache.js";
 import type { ToolModule } from "./types.js";
 
 const NER_LABELS = [
@@ -86,9 +87,17 @@ const tako_graph_related = {
 
     let data: unknown;
     try {
-      data = await djangoGet<unknown>(
-        ctx.env, ctx.token, "/api/beta/graph/related",
-        { query, timeoutMs: 15_000 },
+      // Idempotent read: shares the per-isolate response cache (see
+      // `_response_cache.ts`). `cursor` is part of `query`, so each page
+      // keys separately.
+      data = await cachedCall(
+        responseCacheKey(ctx.token, "/api/beta/graph/related", JSON.stringify(query)),
+        responseCacheTtlMs(ctx.env),
+        15_000,
+        () => djangoGet<unknown>(
+          ctx.env, ctx.token, "/api/beta/graph/related",
+          { query, timeoutMs: 15_000 },
+        ),
       );
     } catch (err) {
       // Log before wrapping: the plain-Error wrap drops the DjangoError
@@ -2,6 +2,7 @@ import { afterEach, describe, expect, it, vi } from "vitest";
 
 import type { Env } from "../env.js";
 import type { ToolContext } from "./types.js";
+import { __response_cache_test_only__ } from "./_response_cache.js";
 import takoGraphSearch from "./tako_graph_search.js";
 import {
   jsonResponse,
@@ -26,6 +27,7 @@ const RESULTS = {
 afterEach(() => {
   vi.unstubAllGlobals();
   vi.restoreAllMocks();
+  __response_cache_test_only__.reset();
 });
 
 describe("tako_graph_search", () => {
@@ -57,6 +59,23 @@ describe("tako_graph_search", () => {
     expect(out.inferred_labels).toEqual(["ORG"]);
   });
 
+  it("shares one GET between concurrent identical calls when the TTL is on, per token", async () => {
+    const cached: ToolContext = { ...CTX, env: { ...ENV, SEARCH_CACHE_TTL_SECONDS: "60" } };
+    const fetchMock = mockFetchSequence([jsonResponse(200, RESULTS), jsonResponse(200, RESULTS)]);
+    const input = { q: "Tesla", types: "entity", label: "ORG", infer_label: true, limit: 5 } as const;
+
+    const [first, second] = await Promise.all([
+      takoGraphSearch.handler(input, cached),
+      takoGraphSearch.handler(input, cached),
+    ]);
+    expect(fetchMock).toHaveBeenCalledTimes(1);
+    expect(second).toEqual(first);
+
+    await takoGraphSearch.handler(input, { ...cached, token: "sk-other" });
+    expect(fetchMock).toHaveBeenCalledTimes(2);
+    expect(requestFrom(fetchMock.mock.calls[1]).headers.get("X-API-Key")).toBe("sk-other");
+  });
+
   it("omits optional params when not provided", async () => {
     const fetchMock = mockFetchSequence([jsonResponse(200, { results: [] })]);
     await takoGraphSearch.handler({ q: "Tesla" }, CTX);
@@ -11,6 +11,7 @@ import { z } from "zod";
 import { djangoGet } from "../django.js";
 import { graphErrorMessage, graphSearchOutputShape } from "./_graph.js";
 import { logWireGuardFailure } from "./_log.js";
+import { cachedCall, responseCacheKey, responseCacheTtlMs } from "./_response_cache.js";
 import type { ToolModule } from "./types.js";
 
 const NER_LABELS = [
@@ -78,9 +79,16 @@ const tako_graph_search = {
 
     let data: unknown;
     try {
-      data = await djangoGet<unknown>(
-        ctx.env, ctx.token, "/api/beta/graph/search",
-        { query, timeoutMs: 15_000 },
+      // Graph lookups are idempotent reads, so they share the per-isolate
+      // response cache with search/answer (see `_response_cache.ts`).
+      data = await cachedCall(
+        responseCacheKey(ctx.token, "/api/beta/graph/search", JSON.stringify(query)),
+        responseCacheTtlMs(ctx.env),
+        15_000,
+        () => djangoGet<unknown>(
+          ctx.env, ctx.token, "/api/beta/graph/search",
+          { query, timeoutMs: 15_000 },
+        ),
       );
     } catch (err) {
       // Log before wrapping: the plain-Error wrap drops the DjangoError
@@ -26,6 +26,7 @@ import { z } from "zod";
 import type { Env } from "../env.js";
 import { SearchRequest } from "../generated/schemas.js";
 import type { ToolContext } from "./types.js";
+import { __response_cache_test_only__ } from "./_response_cache.js";
 import { INLINE_PREVIEW_ROW_CAP, MAX_PREVIEW_ROWS } from "./_search_results.js";
 import tako_search, { buildSearchBody } from "./tako_search.js";
 import {
@@ -63,6 +64,7 @@ const DEFAULTS = {
 afterEach(() => {
   vi.unstubAllGlobals();
   vi.restoreAllMocks();
+  __response_cache_test_only__.reset();
 });
 
 // Regression: the live /api/v3/search response attaches a per-result `content`
@@ -182,6 +184,23 @@ describe("tako_search input schema", () => {
 });
 
 describe("tako_search request body", () => {
+  it("serves a repeat inside the opt-in TTL from the cache, keyed per token", async () => {
+    const cached: ToolContext = { ...CTX, env: { ...ENV, SEARCH_CACHE_TTL_SECONDS: "60" } };
+    const fetchMock = mockFetchSequence([
+      jsonResponse(200, { cards: [], web_results: [], request_id: "r-a" }),
+      jsonResponse(200, { cards: [], web_results: [], request_id: "r-b" }),
+    ]);
+
+    const first = await tako_search.handler({ query: "gold price", ...DEFAULTS }, cached);
+    const repeat = await tako_search.handler({ query: "gold price", ...DEFAULTS }, cached);
+    expect(fetchMock).toHaveBeenCalledTimes(1);
+    expect(repeat).toEqual(first);
+
+    await tako_search.handler({ query: "gold price", ...DEFAULTS }, { ...cached, token: "sk-other" });
+    expect(fetchMock).toHaveBeenCalledTimes(2);
+    expect(requestFrom(fetchMock.mock.calls[1]).headers.get("x-api-key")).toBe("sk-other");
+  });
+
   it("posts to /api/v3/search with a per-source sources object (no flat source_indexes/output_settings)", async () => {
     const fetchMock = mockFetchSequence([
       jsonResponse(200, { cards: [], web_results: [], request_id: "r" }),
@@ -17,7 +17,7 @@
  */
 import { z } from "zod";
 
-import { djangoPost } from "../django.js";
+import { djangoPostJson } from "../django.js";
 import { SearchRequest, SearchResponse } from "../generated/schemas.js";
 import {
   buildChartAppUiResourceFromOutputPubId,
@@ -31,6 +31,7 @@ import {
   searchSlimOutputShape,
   slimSearchStructured,
 } from "./_render_markdown.js";
+import { cachedCall, responseCacheKey, responseCacheTtlMs } from "./_response_cache.js";
 import {
   buildSearchOutput,
   hoistSourceGlossary,
@@ -247,7 +248,16 @@ const tako_search = {
     const body = buildSearchBody(input);
     // v3 fast/instant is synchronous (~120s sync ceiling). No async/202,
     // no polling. Zero matches come back as 200 with empty `cards`.
-    const data = await djangoPost<unknown>(ctx.env, ctx.token, "/api/v3/search/", body, { timeoutMs: 130_000 });
+    //
+    // Repeats inside the opt-in TTL are served from the per-isolate cache
+    // (see `_response_cache.ts`); disabled, this is a plain POST.
+    const json = JSON.stringify(body);
+    const data = await cachedCall(
+      responseCacheKey(ctx.token, "/api/v3/search/", json),
+      responseCacheTtlMs(ctx.env),
+      130_000,
+      () => djangoPostJson<unknown>(ctx.env, ctx.token, "/api/v3/search/", json, { timeoutMs: 130_000 }),
+    );
 
     // Wire-contract guard: validate against the generated SearchResponse before
     // mapping into the normalised MCP output shape.
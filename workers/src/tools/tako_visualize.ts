@@ -431,24 +431,23 @@ const tako_visualize = {
     // Build canonical widget URLs from the card_id (same as tako_search),
     // so inline render works regardless of the URL form the backend returns.
     const { embed_url, image_url } = buildChartUrls(ctx.env, cardId, DEFAULT_DARK_MODE);
-    const parsed = outputSchema.safeParse({
-      title: wire.title ?? undefined,
-      description: wire.description ?? undefined,
-      webpage_url: wire.webpage_url ?? undefined,
+    // Assembled directly rather than re-run through `outputSchema`: every
+    // field is already trusted — the text fields passed the ThinVizCard
+    // guard above, the URLs come from `validatePublicOrigin`-checked bases,
+    // and the dimensions are constants or the range-checked `input.height`.
+    // The backend is the authoritative validator of the card itself.
+    const output: Output = {
       pub_id: cardId,
       embed_url,
       image_url,
       dark_mode: DEFAULT_DARK_MODE,
       width: DEFAULT_WIDTH,
       height: input.height ?? DEFAULT_HEIGHT,
-    });
-    if (!parsed.success) {
-      logWireGuardFailure("tako_visualize", "output-normalise", parsed.error, data);
-      throw new Error(
-        "Tako visualize endpoint returned an unexpected shape. Retry once; if it persists, flag it to the Tako team.",
-      );
-    }
-    return parsed.data;
+    };
+    if (typeof wire.title === "string") output.title = wire.title;
+    if (typeof wire.description === "string") output.description = wire.description;
+    if (typeof wire.webpage_url === "string") output.webpage_url = wire.webpage_url;
+    return output;
   },
   async extraMeta(output, ctx) {
     // Skip the PNG prefetch on ChatGPT (its widget renders embed_url